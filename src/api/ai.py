@@ -1,7 +1,11 @@
 import re
 import json
 import logging
+import weakref
+import asyncio
+import config
 from config import AI_PROVIDER
+from src.utils import fast_json
 from src.utils.text_sanitizer import sanitize_llm_output
 
 logger = logging.getLogger(__name__)
@@ -25,6 +29,9 @@ elif AI_PROVIDER == "openai":
 else:
     raise ValueError(f"Unsupported AI provider: {AI_PROVIDER}. Use 'openai', 'anthropic', or 'gemini'.")
 
+# Optional cheaper model for first-pass strategy calls (empty = disabled)
+fast_model_name = getattr(config, f"{AI_PROVIDER.upper()}_FAST_MODEL_NAME", "") or None
+
 
 def make_ai_request(prompt):
     """Make AI request to the configured provider."""
@@ -58,6 +65,201 @@ def make_ai_request(prompt):
     return ai_resp
 
 
+def make_ai_request_cached(prefix, suffix, timeout=None, model=None):
+    """
+    Make AI request with a static prefix the provider can cache.
+
+    The prefix must be byte-identical across calls. Anthropic gets it as a
+    system block marked with cache_control; OpenAI and Gemini cache matching
+    prompt prefixes automatically. timeout (seconds) bounds the HTTP request
+    so a hung call releases its worker; model overrides the configured one.
+    """
+    logger.info(f"[LLM REQUEST] Provider: {AI_PROVIDER}, Model: {model or model_name}, "
+                f"Prompt length: {len(prefix) + len(suffix)} chars ({len(prefix)} cacheable)")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[LLM REQUEST] Dynamic suffix:\n{suffix}")
+
+    if AI_PROVIDER == "gemini":
+        ai_resp = client.models.generate_content(
+            model=model or model_name,
+            contents=prefix + suffix,
+            **_gemini_timeout_kwargs(timeout)
+        )
+    elif AI_PROVIDER == "anthropic":
+        ai_resp = client.messages.create(
+            model=model or model_name,
+            max_tokens=4096,
+            messages=[{"role": "user", "content": suffix}],
+            **_anthropic_kwargs(prefix, timeout)
+        )
+    else:  # openai
+        ai_resp = client.chat.completions.create(
+            model=model or model_name,
+            messages=_openai_messages(prefix, suffix),
+            **_timeout_kwargs(timeout)
+        )
+
+    raw_response = get_raw_response_content(ai_resp)
+    logger.info(f"[LLM RESPONSE] Length: {len(raw_response)} chars")
+    logger.debug(f"[LLM RESPONSE] Full response:\n{raw_response}")
+
+    return ai_resp
+
+
+def make_ai_request_stream(prefix, suffix, timeout=None, model=None):
+    """
+    Stream a response as text deltas, sending the prefix as in
+    make_ai_request_cached. Closing the generator ends the HTTP stream.
+    """
+    if AI_PROVIDER == "gemini":
+        for chunk in client.models.generate_content_stream(
+            model=model or model_name,
+            contents=prefix + suffix,
+            **_gemini_timeout_kwargs(timeout)
+        ):
+            if chunk.text:
+                yield chunk.text
+    elif AI_PROVIDER == "anthropic":
+        with client.messages.stream(
+            model=model or model_name,
+            max_tokens=4096,
+            messages=[{"role": "user", "content": suffix}],
+            **_anthropic_kwargs(prefix, timeout)
+        ) as stream:
+            yield from stream.text_stream
+    else:  # openai
+        stream = client.chat.completions.create(
+            model=model or model_name,
+            messages=_openai_messages(prefix, suffix),
+            stream=True,
+            **_timeout_kwargs(timeout)
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            stream.close()
+
+
+def make_ai_request_streamed_json(prefix, suffix, timeout=None, model=None):
+    """
+    Stream a response and stop as soon as its first JSON object is complete.
+
+    Returns sanitized text like get_raw_response_content, minus anything the
+    model would have written after the object.
+    """
+    logger.info(f"[LLM REQUEST] Provider: {AI_PROVIDER}, Model: {model or model_name}, "
+                f"Prompt length: {len(prefix) + len(suffix)} chars ({len(prefix)} cacheable, streamed)")
+    scanner = fast_json.ObjectScanner()
+    parts = []
+    stream = make_ai_request_stream(prefix, suffix, timeout, model)
+    try:
+        for delta in stream:
+            end = scanner.feed(delta)
+            if end is not None:
+                parts.append(delta[:end])
+                break
+            parts.append(delta)
+    finally:
+        stream.close()
+
+    raw_response = sanitize_llm_output("".join(parts).strip())
+    logger.info(f"[LLM RESPONSE] Length: {len(raw_response)} chars (streamed)")
+    return raw_response
+
+
+def _timeout_kwargs(timeout):
+    """Per-request timeout for the OpenAI/Anthropic SDKs (seconds)."""
+    return {"timeout": timeout} if timeout is not None else {}
+
+
+def _gemini_timeout_kwargs(timeout):
+    """Per-request timeout for google-genai, which takes milliseconds."""
+    if timeout is None:
+        return {}
+    # At least 1 ms: google-genai reads a 0 timeout as "no timeout"
+    return {"config": {"http_options": {"timeout": max(1, int(timeout * 1000))}}}
+
+
+def _anthropic_kwargs(prefix, timeout):
+    """Cacheable system block (if any) plus timeout for messages.create."""
+    kwargs = _timeout_kwargs(timeout)
+    if prefix:
+        kwargs["system"] = [{"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}]
+    return kwargs
+
+
+def _openai_messages(prefix, suffix):
+    """Chat messages with the static prefix (if any) as the system message."""
+    messages = [{"role": "user", "content": suffix}]
+    if prefix:
+        messages.insert(0, {"role": "system", "content": prefix})
+    return messages
+
+
+# Async clients are bound to the event loop that created them
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _get_async_client():
+    """Return this event loop's async client, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    async_client = _async_clients.get(loop)
+    if async_client is None:
+        if AI_PROVIDER == "gemini":
+            async_client = client.aio
+        elif AI_PROVIDER == "anthropic":
+            from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+            import httpx
+            async_client = AsyncAnthropic(
+                api_key=ANTHROPIC_API_KEY,
+                http_client=DefaultAsyncHttpxClient(limits=httpx.Limits(max_keepalive_connections=16)),
+            )
+        else:  # openai
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+            import httpx
+            async_client = AsyncOpenAI(
+                api_key=OPENAI_API_KEY,
+                http_client=DefaultAsyncHttpxClient(limits=httpx.Limits(max_keepalive_connections=16)),
+            )
+        _async_clients[loop] = async_client
+    return async_client
+
+
+async def make_ai_request_cached_async(prefix, suffix, timeout=None, model=None):
+    """Async version of make_ai_request_cached for use inside an event loop."""
+    async_client = _get_async_client()
+    logger.info(f"[LLM REQUEST] Provider: {AI_PROVIDER}, Model: {model or model_name}, "
+                f"Prompt length: {len(prefix) + len(suffix)} chars ({len(prefix)} cacheable, async)")
+
+    if AI_PROVIDER == "gemini":
+        ai_resp = await async_client.models.generate_content(
+            model=model or model_name,
+            contents=prefix + suffix,
+            **_gemini_timeout_kwargs(timeout)
+        )
+    elif AI_PROVIDER == "anthropic":
+        ai_resp = await async_client.messages.create(
+            model=model or model_name,
+            max_tokens=4096,
+            messages=[{"role": "user", "content": suffix}],
+            **_anthropic_kwargs(prefix, timeout)
+        )
+    else:  # openai
+        ai_resp = await async_client.chat.completions.create(
+            model=model or model_name,
+            messages=_openai_messages(prefix, suffix),
+            **_timeout_kwargs(timeout)
+        )
+
+    raw_response = get_raw_response_content(ai_resp)
+    logger.info(f"[LLM RESPONSE] Length: {len(raw_response)} chars")
+    logger.debug(f"[LLM RESPONSE] Full response:\n{raw_response}")
+
+    return ai_resp
+
+
 def parse_ai_response(ai_response):
     """Parse AI response from the configured provider."""
     try:
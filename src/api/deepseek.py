@@ -29,7 +29,7 @@ def _get_client() -> OpenAI:
     return _client
 
 
-def make_deepseek_request(prompt: str, max_tokens: int = 64000) -> str:
+def make_deepseek_request(prompt: str, max_tokens: int = 64000, system: str = "") -> str:
     """
     Make a request to DeepSeek API.
 
@@ -43,23 +43,38 @@ def make_deepseek_request(prompt: str, max_tokens: int = 64000) -> str:
     Args:
         prompt: The prompt to send
         max_tokens: Maximum tokens for TOTAL output (CoT + answer). Default 64000.
+        system: Static instructions sent as a system message ahead of the
+            prompt. DeepSeek caches repeated prefixes automatically, so
+            keeping this byte-identical across calls makes them cache hits.
 
     Returns:
         Response text from DeepSeek (the final answer/content)
     """
     client = _get_client()
 
-    logger.info(f"[DeepSeek] Request to {DEEPSEEK_MODEL_NAME}, prompt length: {len(prompt)} chars, max_tokens: {max_tokens}")
-    logger.debug(f"[DeepSeek] Full prompt:\n{prompt}")
+    logger.info(f"[DeepSeek] Request to {DEEPSEEK_MODEL_NAME}, prompt length: {len(system) + len(prompt)} chars, max_tokens: {max_tokens}")
+    logger.debug(f"[DeepSeek] Full prompt:\n{system}{prompt}")
+
+    messages = [{"role": "user", "content": prompt}]
+    if system:
+        messages.insert(0, {"role": "system", "content": system})
 
     response = client.chat.completions.create(
         model=DEEPSEEK_MODEL_NAME,
-        messages=[{"role": "user", "content": prompt}],
+        messages=messages,
         max_tokens=max_tokens,
         stream=False
         # Note: temperature has no effect in thinking/reasoner mode
     )
 
+    usage = getattr(response, 'usage', None)
+    if usage is not None:
+        logger.debug(
+            "[DeepSeek] Prompt cache: %s hit / %s miss tokens",
+            getattr(usage, 'prompt_cache_hit_tokens', None),
+            getattr(usage, 'prompt_cache_miss_tokens', None),
+        )
+
     message = response.choices[0].message
 
     # DeepSeek-Reasoner: reasoning_content = CoT, content = final answer
@@ -1,6 +1,8 @@
 import robin_stocks.robinhood as rh
+import robin_stocks.robinhood.globals as rh_globals
 import robin_stocks.robinhood.urls as rh_urls
 import time
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from pytz import timezone
 import pandas as pd
@@ -12,6 +14,7 @@ from config import MODE, ROBINHOOD_USERNAME, ROBINHOOD_PASSWORD
 from config import OP_SERVICE_ACCOUNT_NAME, OP_SERVICE_ACCOUNT_TOKEN, OP_VAULT_NAME, OP_ITEM_NAME
 
 account_info_cache = {}
+http_session_configured = False
 
 # Main login function that orchestrates the login process
 async def login_to_robinhood():
@@ -40,6 +43,7 @@ async def login_to_robinhood():
             if 'detail' in login_resp:
                 logger.debug(f"Login info: {login_resp['detail']}")
             logger.debug("Robinhood login successful.")
+            configure_http_session()
             return login_resp
         if 'detail' in login_resp:
             logger.error(f"Login failed - {login_resp['detail']}")
@@ -62,6 +66,19 @@ async def login_to_robinhood():
         return None
 
 
+# Size the keep-alive connection pool of robin_stocks' shared requests.Session
+# (covers concurrent quote fetches and strategy threads; mounted once per process)
+def configure_http_session(pool_connections=4, pool_maxsize=8):
+    global http_session_configured
+    if http_session_configured:
+        return
+    session = rh_globals.SESSION
+    session.mount("https://", HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize))
+    session.headers["Connection"] = "keep-alive"
+    http_session_configured = True
+    logger.debug(f"Robinhood HTTP session pool configured (connections={pool_connections}, maxsize={pool_maxsize})")
+
+
 # Run a Robinhood function with retries and delay between attempts (to handle rate limits)
 def rh_run_with_retries(func, *args, max_retries=3, delay=60, **kwargs):
     for attempt in range(max_retries):
@@ -161,6 +161,20 @@ class DecisionBuffer:
             'date': self._current_date,
         }
     
+    def peek_decisions(self, limit: int) -> List[Dict]:
+        """Get the first `limit` buffered decisions without copying the rest."""
+        return self._decisions[:limit]
+    
+    @property
+    def current_date(self) -> Optional[str]:
+        """Trading date the buffer belongs to."""
+        return self._current_date
+    
+    @property
+    def start_of_day_value(self) -> Optional[float]:
+        """Portfolio value at start of day."""
+        return self._start_of_day_value
+    
     def clear_buffer(self):
         """Clear the buffer after EOD review completes."""
         self._decisions = []
@@ -4,13 +4,21 @@ Slider Module — TQQQ/SQQQ allocation based on multi-strategy LLM analysis.
 
 from .slider_bot import SliderBot
 from .data_feed import QQQDataFeed
-from .strategy_nodes import run_strategy_nodes, get_registered_strategies
-from .synthesizer import synthesize_final_slider
+from .strategy_nodes import (
+    run_strategy_nodes,
+    run_strategy_nodes_async,
+    get_registered_strategies,
+    clear_strategy_cache,
+)
+from .synthesizer import synthesize_final_slider, clear_synthesis_cache
 
 __all__ = [
     "SliderBot",
     "QQQDataFeed",
     "run_strategy_nodes",
+    "run_strategy_nodes_async",
     "get_registered_strategies",
+    "clear_strategy_cache",
     "synthesize_final_slider",
+    "clear_synthesis_cache",
 ]
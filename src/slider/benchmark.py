@@ -17,6 +17,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 
+from src.utils import fast_json
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_STATE_FILE = "benchmark_state.json"
@@ -93,8 +95,8 @@ class BenchmarkTracker:
             data['start_time'] = self.start_time
             
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(self.state_file, 'wb') as f:
+                f.write(fast_json.dumps(data, indent=True))
         except Exception as e:
             logger.error(f"Failed to save benchmark state: {e}")
 
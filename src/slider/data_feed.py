@@ -9,6 +9,7 @@ Uses decaying time intervals:
 This keeps total prompt rows reasonable (~30-40 rows max).
 """
 
+import functools
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
@@ -26,6 +27,8 @@ logger = logging.getLogger(__name__)
 # QQQ is our reference symbol for NASDAQ direction
 REFERENCE_SYMBOL = "QQQ"
 
+ET_TZ = timezone('US/Eastern')
+
 # Time buckets for decaying resolution
 # (hours_ago_start, hours_ago_end, bucket_minutes)
 TIME_BUCKETS = [
@@ -77,20 +80,24 @@ def get_market_session() -> Dict:
         - minutes_remaining: Minutes until session ends
         - phase_specific_notes: Key trading considerations for this phase
     """
-    et_tz = timezone('US/Eastern')
-    now = datetime.now(et_tz)
-    current_hour = now.hour
-    current_minutes = now.hour * 60 + now.minute
+    now = datetime.now(ET_TZ)
+    return dict(_session_for_minute(now.hour, now.minute))
+
+
+@functools.lru_cache(maxsize=1440)
+def _session_for_minute(current_hour: int, current_minute: int) -> Dict:
+    """Session info for a wall-clock minute; treat the cached dict as read-only."""
+    current_minutes = current_hour * 60 + current_minute
 
     # Check for overnight session first (wraps around midnight: 20:00-04:00)
     # Overnight is active if hour >= 20 OR hour < 4
     if current_hour >= 20 or current_hour < 4:
         if current_hour >= 20:
             # Before midnight: minutes until 04:00 next day
-            mins_remaining = (24 - current_hour + 4) * 60 - now.minute
+            mins_remaining = (24 - current_hour + 4) * 60 - current_minute
         else:
             # After midnight: minutes until 04:00
-            mins_remaining = (4 - current_hour) * 60 - now.minute
+            mins_remaining = (4 - current_hour) * 60 - current_minute
         
         return {
             "session_name": OVERNIGHT_SESSION["name"],
@@ -136,53 +143,55 @@ def get_market_session() -> Dict:
 
 def _get_phase_notes(session_name: str) -> str:
     """Get phase-specific trading notes."""
-    notes = {
-        "overnight": (
-            "- Asian session (18:00-03:00 ET) defines support/resistance range\n"
-            "- London Breakout at 03:00 ET signals NY direction (70% accuracy)\n"
-            "- If London breaks Asian range, NY typically continues that direction\n"
-            "- Use Half-Kelly (0.5f) - do not hold TQQQ/SQQQ overnight\n"
-            "- NQ futures preferred for overnight positioning"
-        ),
-        "pre_market": (
-            "- Wide spreads indicate fake breakouts; check spread before entry\n"
-            "- London Breakout (03:00-04:00 ET) often predicts NY direction\n"
-            "- Gap Quality = (Volume / Avg) × (1 / Spread)\n"
-            "- Use Full Kelly (1.0f) sizing for high-conviction setups"
-        ),
-        "market_open": (
-            "- VIX-adjusted ORB: High VIX = 2-5 min bars, Low VIX = 30 min bars\n"
-            "- Use Fibonacci pullback entries (50%/61.8%) instead of chasing breakouts\n"
-            "- TICK > 1000 signals institutional drive\n"
-            "- Use Full Kelly (1.0f) sizing for high-conviction setups"
-        ),
-        "lunch": (
-            "- Tighten Bollinger Bands from 2.0 to 1.5 SD (lower volatility)\n"
-            "- VWAP mean reversion is dominant strategy\n"
-            "- Avoid momentum plays; favor mean reversion\n"
-            "- Use Half-Kelly (0.5f) - this is the worst time for directional bets"
-        ),
-        "power_hour": (
-            "- MOC imbalances at 15:50 ET predict close direction\n"
-            "- Institutions defend VWAP aggressively\n"
-            "- Lunch ambiguity resolves with directional break\n"
-            "- Use Full Kelly (1.0f) sizing for high-conviction setups"
-        ),
-        "after_market": (
-            "- Thin liquidity creates volatile moves on earnings\n"
-            "- Liquidity void fills are common\n"
-            "- Wide spreads = higher slippage risk\n"
-            "-Use Full Kelly (1.0f) sizing for high-conviction setups"
-        ),
-    }
-    return notes.get(session_name, "No specific notes for this session.")
+    return _PHASE_NOTES.get(session_name, "No specific notes for this session.")
+
+
+_PHASE_NOTES = {
+    "overnight": (
+        "- Asian session (18:00-03:00 ET) defines support/resistance range\n"
+        "- London Breakout at 03:00 ET signals NY direction (70% accuracy)\n"
+        "- If London breaks Asian range, NY typically continues that direction\n"
+        "- Use Half-Kelly (0.5f) - do not hold TQQQ/SQQQ overnight\n"
+        "- NQ futures preferred for overnight positioning"
+    ),
+    "pre_market": (
+        "- Wide spreads indicate fake breakouts; check spread before entry\n"
+        "- London Breakout (03:00-04:00 ET) often predicts NY direction\n"
+        "- Gap Quality = (Volume / Avg) × (1 / Spread)\n"
+        "- Use Full Kelly (1.0f) sizing for high-conviction setups"
+    ),
+    "market_open": (
+        "- VIX-adjusted ORB: High VIX = 2-5 min bars, Low VIX = 30 min bars\n"
+        "- Use Fibonacci pullback entries (50%/61.8%) instead of chasing breakouts\n"
+        "- TICK > 1000 signals institutional drive\n"
+        "- Use Full Kelly (1.0f) sizing for high-conviction setups"
+    ),
+    "lunch": (
+        "- Tighten Bollinger Bands from 2.0 to 1.5 SD (lower volatility)\n"
+        "- VWAP mean reversion is dominant strategy\n"
+        "- Avoid momentum plays; favor mean reversion\n"
+        "- Use Half-Kelly (0.5f) - this is the worst time for directional bets"
+    ),
+    "power_hour": (
+        "- MOC imbalances at 15:50 ET predict close direction\n"
+        "- Institutions defend VWAP aggressively\n"
+        "- Lunch ambiguity resolves with directional break\n"
+        "- Use Full Kelly (1.0f) sizing for high-conviction setups"
+    ),
+    "after_market": (
+        "- Thin liquidity creates volatile moves on earnings\n"
+        "- Liquidity void fills are common\n"
+        "- Wide spreads = higher slippage risk\n"
+        "-Use Full Kelly (1.0f) sizing for high-conviction setups"
+    ),
+}
 
 
 class QQQDataFeed:
     """Fetches and formats QQQ market data for slider analysis."""
     
     def __init__(self):
-        self.et_tz = timezone('US/Eastern')
+        self.et_tz = ET_TZ
         self._cache = {}
         self._cache_time = None
         self._cache_ttl = timedelta(seconds=30)  # Cache for 30 seconds
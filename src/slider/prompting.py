@@ -0,0 +1,83 @@
+"""
+Prompt templates — loading, rendering and response cleanup shared by the
+strategy nodes and the synthesizer.
+
+Templates live in prompts/ and are split at CACHE_BREAKPOINT into a static
+prefix (sent verbatim so providers can cache it) and a per-tick suffix with
+{placeholder} fields.
+"""
+
+import functools
+import logging
+import re
+from pathlib import Path
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Path to prompts directory
+PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts"
+
+# Separates the static rulebook of a prompt from its per-tick data
+CACHE_BREAKPOINT = "<!-- CACHE_BREAKPOINT -->"
+
+# Template placeholders look like {market_data}; JSON examples in prompts don't match
+_PLACEHOLDER_RE = re.compile(r"\{([a-z_]+)\}")
+
+# JSON object in an LLM response, optionally wrapped in a ```json fence
+_FENCE_RE = re.compile(r"^\s*(?:```(?:json)?\s*)?(\{.*\})\s*(?:```)?\s*$", re.DOTALL)
+
+
+def load_prompt(filename: str) -> Tuple[str, str]:
+    """Load prompt template from file as (static_prefix, dynamic_suffix).
+
+    The split is at CACHE_BREAKPOINT; everything before it is sent verbatim
+    so the provider can cache it, and only the suffix has placeholders.
+    Templates without the marker are all suffix.
+
+    Each file is read once per modification time, so edits are picked up
+    on the next call without re-reading unchanged files.
+    """
+    path = PROMPTS_DIR / filename
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        logger.error(f"Prompt file not found: {path}")
+        return "", ""
+    return _load_prompt_cached(filename, mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_prompt_cached(filename: str, mtime_ns: int) -> Tuple[str, str]:
+    """Read and split a prompt file; mtime_ns only keys the cache."""
+    template = (PROMPTS_DIR / filename).read_text(encoding='utf-8')
+    prefix, marker, suffix = template.partition(CACHE_BREAKPOINT)
+    if not marker:
+        return "", template
+    return prefix, suffix.lstrip("\n")
+
+
+@functools.lru_cache(maxsize=32)
+def compile_prompt(template: str) -> Tuple[str, ...]:
+    """
+    Split a prompt template into literal text and placeholder names.
+
+    Even indexes hold literal text, odd indexes hold placeholder names.
+    Keyed on the template string itself, so edits produce a new entry.
+    """
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+def render_prompt(segments: Tuple[str, ...], values: Dict[str, str]) -> str:
+    """Fill placeholders in one pass; unknown placeholders are left as-is."""
+    parts = list(segments)
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        parts[i] = values.get(name, "{" + name + "}")
+    return "".join(parts)
+
+
+def strip_fences(raw: str) -> str:
+    """Return the JSON body of an LLM response, without any markdown code fence."""
+    match = _FENCE_RE.match(raw)
+    return match.group(1) if match else raw.strip()
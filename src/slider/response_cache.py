@@ -0,0 +1,96 @@
+"""
+Response Cache — SQLite-backed store of raw LLM responses.
+
+Survives process restarts, so a bot restarted mid-bar doesn't pay again for
+prompts it answered minutes earlier. Entries older than the TTL are ignored
+and periodically purged.
+
+Any SQLite or filesystem error disables the cache for the rest of the
+process instead of failing the strategy run.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+PURGE_EVERY_N_PUTS = 100
+
+
+class DiskResponseCache:
+    """Key/value store of raw responses with a TTL, safe to share across threads."""
+
+    def __init__(self, path: Path, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._disabled = False
+        self._puts = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use. Caller holds the lock."""
+        if self._conn is None and not self._disabled:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS c (k TEXT PRIMARY KEY, v BLOB, ts INTEGER)")
+            self._conn = conn
+        return self._conn
+
+    def _disable(self, e: Exception):
+        logger.warning(f"Disk response cache disabled ({self.path}): {e}")
+        self._disabled = True
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key if it is younger than the TTL."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                if conn is None:
+                    return None
+                row = conn.execute(
+                    "SELECT v FROM c WHERE k = ? AND ts > ?",
+                    (key, int(time.time()) - self.ttl_seconds),
+                ).fetchone()
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+                return None
+        return row[0].decode('utf-8') if row else None
+
+    def put(self, key: str, value: str):
+        """Store a response, purging expired rows every PURGE_EVERY_N_PUTS writes."""
+        now = int(time.time())
+        with self._lock:
+            try:
+                conn = self._connect()
+                if conn is None:
+                    return
+                conn.execute(
+                    "INSERT OR REPLACE INTO c (k, v, ts) VALUES (?, ?, ?)",
+                    (key, value.encode('utf-8'), now),
+                )
+                self._puts += 1
+                if self._puts % PURGE_EVERY_N_PUTS == 0:
+                    conn.execute("DELETE FROM c WHERE ts <= ?", (now - self.ttl_seconds,))
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
+
+    def clear(self):
+        """Delete every entry."""
+        with self._lock:
+            try:
+                conn = self._connect()
+                if conn is not None:
+                    conn.execute("DELETE FROM c")
+            except (sqlite3.Error, OSError) as e:
+                self._disable(e)
@@ -0,0 +1,138 @@
+"""
+Semantic Cache for strategy LLM results.
+
+Consecutive ticks produce near-identical prompts (one new bar of market data),
+so an exact-match cache rarely hits. This cache embeds each prompt and reuses
+the stored result of the most similar earlier prompt when cosine similarity
+clears a threshold.
+
+Embeddings come from sentence-transformers (all-MiniLM-L6-v2, CPU). It is an
+optional dependency: if it isn't installed, or the model can't be loaded,
+embed() returns None and callers skip the cache. The model only reads the
+first 256 tokens of its input, so callers embed a compact summary rather
+than a whole prompt.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_SIMILARITY_THRESHOLD = 0.985
+DEFAULT_MAX_AGE_SECONDS = 60
+
+_model = None
+_model_lock = threading.Lock()
+_model_unavailable = False
+
+
+def embed(text: str) -> Optional[np.ndarray]:
+    """
+    Embed text as an L2-normalized float32 vector.
+
+    Returns None if sentence-transformers isn't available or the model
+    fails to load (e.g. offline with no cached weights).
+    """
+    global _model, _model_unavailable
+    if _model_unavailable:
+        return None
+
+    if _model is None:
+        with _model_lock:
+            if _model is None and not _model_unavailable:
+                if SentenceTransformer is None:
+                    logger.warning("sentence-transformers not installed, semantic cache disabled")
+                    _model_unavailable = True
+                    return None
+                logger.info(f"Loading embedding model {EMBEDDING_MODEL_NAME}...")
+                try:
+                    _model = SentenceTransformer(EMBEDDING_MODEL_NAME, device="cpu")
+                except Exception as e:
+                    logger.warning(f"Could not load {EMBEDDING_MODEL_NAME}, semantic cache disabled: {e}")
+                    _model_unavailable = True
+                    return None
+            if _model is None:
+                return None
+
+    vector = _model.encode(text, normalize_embeddings=True, convert_to_numpy=True)
+    return vector.astype(np.float32, copy=False)
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache of result dicts keyed by prompt embedding.
+
+    Embeddings live in a preallocated (max_entries, d) matrix so a lookup is a
+    single matrix-vector product. Entries older than max_age_seconds are never
+    returned. Once full, the least recently used row is overwritten.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.max_age_seconds = max_age_seconds
+        self._matrix: Optional[np.ndarray] = None
+        self._added_at = np.zeros(max_entries)  # time.monotonic() per row
+        self._results: Dict[int, Dict] = {}
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+        self._n_rows = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._n_rows
+
+    def lookup(self, embedding: np.ndarray) -> Optional[Dict]:
+        """Return a copy of the closest cached result, or None if nothing is similar enough."""
+        with self._lock:
+            if self._n_rows == 0:
+                return None
+            sims = self._matrix[:self._n_rows] @ embedding
+            expired = self._added_at[:self._n_rows] <= time.monotonic() - self.max_age_seconds
+            sims[expired] = -np.inf
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+            self._lru.move_to_end(best)
+            return dict(self._results[best])
+
+    def add(self, embedding: np.ndarray, result: Dict):
+        """Store a result under its prompt embedding."""
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.zeros((self.max_entries, embedding.shape[0]), dtype=np.float32)
+
+            if self._n_rows < self.max_entries:
+                row = self._n_rows
+                self._n_rows += 1
+            else:
+                row, _ = self._lru.popitem(last=False)
+
+            self._matrix[row] = embedding
+            self._added_at[row] = time.monotonic()
+            self._results[row] = dict(result)
+            self._lru[row] = None
+            self._lru.move_to_end(row)
+
+    def clear(self):
+        """Drop all entries, keeping the allocated matrix."""
+        with self._lock:
+            self._results.clear()
+            self._lru.clear()
+            self._n_rows = 0
@@ -5,20 +5,29 @@ Demo-only mode with $10k pool, disjoint from existing holdings.
 Runs on 5-minute intervals.
 """
 
+import atexit
+import bisect
 import json
 import logging
+import os
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 
+import robin_stocks.robinhood as rh
 from pytz import timezone
 
+import config
 from src.api import robinhood
+from src.utils import fast_json
 from .data_feed import QQQDataFeed, get_market_session
-from .strategy_nodes import run_strategy_nodes
-from .synthesizer import synthesize_final_slider, format_slider_for_display
+from .strategy_nodes import run_strategy_nodes, clear_strategy_cache
+from .synthesizer import synthesize_final_slider, format_slider_for_display, clear_synthesis_cache
 from .kb_materializer import SliderKBWriter
 from .benchmark import BenchmarkTracker
 
@@ -29,6 +38,51 @@ DEMO_POOL_SIZE = 10000.0  # $10k demo pool
 TQQQ_SYMBOL = "TQQQ"
 SQQQ_SYMBOL = "SQQQ"
 DEFAULT_INTERVAL_SECONDS = 300  # 5 minutes
+STATUS_CACHE_TTL_SECONDS = 60  # get_status() reuses last cycle's prices within this window
+PRICE_CACHE_TTL_SECONDS = 30  # Quotes younger than this are served from memory
+
+# Price fetches that overlap the strategy LLM calls; shared by every bot so
+# one rebuilt by the server doesn't leave a pool of threads behind
+_PRICE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="slider-prices")
+atexit.register(_PRICE_EXECUTOR.shutdown, wait=False)
+
+# KB/history writes run off the cycle path; one worker keeps them in order.
+# Shared for the same reason as _PRICE_EXECUTOR, and drained at exit so
+# queued writes still reach disk
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slider-io")
+atexit.register(_IO_EXECUTOR.shutdown, wait=True)
+
+# History is JSONL; slider_history.json is the pre-JSONL format, converted on load
+HISTORY_PATH = Path("slider_history.jsonl")
+LEGACY_HISTORY_PATH = Path("slider_history.json")
+
+# Bound once so the quote path skips the attribute chain on every call
+_GET_QUOTES = rh.stocks.get_quotes
+
+# Action labels by slider band (_ACTION_LABELS[i] covers slider up to _ACTION_THRESHOLDS[i])
+_ACTION_THRESHOLDS = (-0.5, -0.1, -0.05, 0.05, 0.1, 0.5)
+_ACTION_LABELS = (
+    "STRONG BUY SQQQ", "BUY SQQQ", "LIGHT SQQQ", "NEUTRAL",
+    "LIGHT TQQQ", "BUY TQQQ", "STRONG BUY TQQQ",
+)
+_NEUTRAL_INDEX = 3
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write data to a temp file in one pass, then rename it over path.
+
+    Readers (the web UI watcher) see either the old or the new file,
+    never a partially written one.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
 
 @dataclass
@@ -64,27 +118,92 @@ class DemoPosition:
 
 @dataclass
 class SliderHistory:
-    """Track slider history for analysis."""
-    entries: List[Dict] = field(default_factory=list)
+    """
+    Track slider history for analysis.
+
+    Persisted as JSONL: each cycle appends one line, and the file is
+    rewritten to the trimmed in-memory tail only on compact(). Older
+    versions saved one pretty-printed JSON list to slider_history.json;
+    load() converts that on first start.
+    """
+    entries: Deque[Dict] = field(default_factory=deque)
     max_entries: int = 288  # ~24 hours at 5-min intervals
+    lines_on_disk: int = 0
+    
+    def __post_init__(self):
+        # Bounded deque drops the oldest entry on append once full
+        self.entries = deque(self.entries, maxlen=self.max_entries)
     
     def add(self, timestamp: datetime, slider: float, confidence: float, 
-            strategy_results: Dict, pnl: float):
-        self.entries.append({
+            strategy_results: Dict, pnl: float) -> Dict:
+        entry = {
             "timestamp": timestamp.isoformat(),
             "slider": slider,
             "confidence": confidence,
             "strategy_results": strategy_results,
             "pnl": pnl,
-        })
-        # Trim to max entries
-        if len(self.entries) > self.max_entries:
-            self.entries = self.entries[-self.max_entries:]
+        }
+        self.entries.append(entry)
+        return entry
     
-    def save(self, path: Path):
-        """Save history to file."""
-        with open(path, 'w') as f:
-            json.dump(self.entries, f, indent=2)
+    @classmethod
+    def load(cls, path: Path, legacy_path: Optional[Path] = None) -> "SliderHistory":
+        """
+        Load the most recent entries from a history file.
+        
+        If path doesn't exist but legacy_path does, the legacy file is read
+        instead, rewritten to path as JSONL and deleted. A legacy JSON list
+        found at path itself is rewritten in place.
+        """
+        history = cls()
+        source = path
+        if not path.exists():
+            if legacy_path is None or not legacy_path.exists():
+                return history
+            source = legacy_path
+        
+        data = source.read_bytes()
+        if data.lstrip().startswith(b'['):
+            # Legacy format: the whole history as one JSON list
+            history.entries.extend(fast_json.loads(data))
+            history.compact(path)
+            if source != path:
+                source.unlink()
+            logger.info(f"Converted slider history {source} to JSONL at {path}")
+            return history
+        
+        damaged = False
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                history.entries.append(fast_json.loads(line))
+            except fast_json.JSONDecodeError:
+                # A write cut short by a crash leaves a partial last line
+                logger.warning(f"Skipping unreadable line in {path}")
+                damaged = True
+            history.lines_on_disk += 1
+        if damaged:
+            # Rewrite so the next append doesn't land on the partial line
+            history.compact(path)
+        return history
+    
+    def append(self, path: Path, entry: Dict):
+        """Append a single entry to the history file."""
+        with open(path, 'ab') as f:
+            f.write(fast_json.dumps(entry) + b'\n')
+        self.lines_on_disk += 1
+        # Keep the file from growing without bound on long runs
+        if self.lines_on_disk > 2 * self.max_entries:
+            self.compact(path)
+    
+    def compact(self, path: Path):
+        """Rewrite the history file with only the trimmed in-memory entries."""
+        # Snapshot first: compaction can run on the I/O worker while the cycle appends
+        entries = list(self.entries)
+        with open(path, 'wb') as f:
+            f.writelines(fast_json.dumps(entry) + b'\n' for entry in entries)
+        self.lines_on_disk = len(entries)
 
 
 class SliderBot:
@@ -114,33 +233,57 @@ class SliderBot:
         self.interval_seconds = interval_seconds
         self.demo_pool = demo_pool
         self.min_slider_change = min_slider_change
-        self.history_path = history_path or Path("slider_history.json")
+        self.history_path = history_path or HISTORY_PATH
+        # Only the default location can have a pre-JSONL file to pick up
+        self._legacy_history_path = LEGACY_HISTORY_PATH if history_path is None else None
         
         self.et_tz = timezone('US/Eastern')
         self.data_feed = QQQDataFeed()
         self.position = DemoPosition(cash=demo_pool)
-        self.history = SliderHistory()
+        try:
+            self.history = SliderHistory.load(self.history_path, self._legacy_history_path)
+        except Exception as e:
+            logger.warning(f"Failed to load slider history, starting empty: {e}")
+            self.history = SliderHistory()
         self.kb_writer = SliderKBWriter()  # KB materialization
         self.benchmark_tracker = BenchmarkTracker(initial_capital=demo_pool)  # Benchmark tracking
         
         self.current_slider = 0.0
         self.running = False
+        self._stop_evt = threading.Event()  # Set by stop() to cut the inter-cycle wait short
+        self._last_status_hash: Optional[int] = None  # Skips status writes when nothing moved
+        # Last cycle's prices/total, reused by get_status() between cycles
+        self._last_state: Optional[Dict] = None
+        # symbol -> (price, time.monotonic() when fetched)
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+        # (market open epoch, market close epoch, valid until epoch) for today in ET
+        self._session_bounds: Tuple[float, float, float] = (0.0, 0.0, 0.0)
         
         logger.info(f"SliderBot initialized: ${demo_pool:,.0f} demo pool, {interval_seconds}s interval")
     
     def run(self):
         """Main loop — run until stopped."""
         self.running = True
+        self._stop_evt.clear()
         logger.info("SliderBot starting...")
+        last_session_name = None
         
         while self.running:
             # Check if we're in a tradable session
             session = get_market_session()
+            
+            # Cached LLM answers don't carry over between sessions
+            if session['session_name'] != last_session_name:
+                if last_session_name is not None:
+                    clear_strategy_cache()
+                    clear_synthesis_cache()
+                last_session_name = session['session_name']
             tradable, reason = self._is_tradable_hours(session)
             
             if not tradable:
                 logger.info(f"Not tradable: {reason}. Waiting 60s...")
-                time.sleep(60)
+                if self._stop_evt.wait(60):
+                    break
                 continue
             
             try:
@@ -151,7 +294,8 @@ class SliderBot:
             # Dynamic interval based on session
             interval = self._get_session_interval(session)
             logger.info(f"[{session['session_name'].upper()}] Sleeping {interval}s until next cycle...")
-            time.sleep(interval)
+            if self._stop_evt.wait(interval):
+                break
         
         logger.info("SliderBot stopped")
     
@@ -164,6 +308,7 @@ class SliderBot:
         """
         cycle_start = datetime.now(self.et_tz)
         logger.info(f"=== Slider Cycle @ {cycle_start.strftime('%H:%M:%S')} ===")
+        self._prune_price_cache(self.interval_seconds / 2)
         
         # 1. Fetch market data
         market_data = self.data_feed.get_market_data()
@@ -171,8 +316,10 @@ class SliderBot:
         opening_range_str = self.data_feed.format_opening_range(market_data)
         gap_info_str = self.data_feed.format_gap_info(market_data)
         
-        # 2. Run strategy nodes concurrently
-        import config
+        # 2. Run strategy nodes concurrently, fetching prices in the background
+        prices_future = _PRICE_EXECUTOR.submit(
+            self._get_prices, [TQQQ_SYMBOL, SQQQ_SYMBOL, "VOO"]
+        )
         strategy_results = run_strategy_nodes(
             market_data=market_data_str,
             extra_context={
@@ -183,17 +330,13 @@ class SliderBot:
         )
         
         # 3. Update Benchmark Tracker
-        # Fetch current prices
-        qqq_price = market_data.get('current_price', 0)
-        tqqq_price = self._get_price(TQQQ_SYMBOL)
-        sqqq_price = self._get_price(SQQQ_SYMBOL)
-        voo_price = self._get_price("VOO")
-        
-        self.benchmark_tracker.update({
-            "TQQQ": tqqq_price,
-            "QQQ": qqq_price,
-            "VOO": voo_price
-        })
+        # Cycle-scoped prices: fetched alongside the strategy nodes, QQQ from the feed
+        prices = prices_future.result()
+        prices["QQQ"] = market_data.get('current_price', 0)
+        tqqq_price = prices[TQQQ_SYMBOL]
+        sqqq_price = prices[SQQQ_SYMBOL]
+        
+        self.benchmark_tracker.update(prices)
 
         # 4. Synthesize final slider
         # Pass full market data (same as strategies receive) for DeepSeek to analyze
@@ -202,56 +345,62 @@ class SliderBot:
         new_slider = synthesis.get("final_slider", 0.0)
         confidence = synthesis.get("confidence", 0.0)
         
-        logger.info("\n" + format_slider_for_display(synthesis, total_strategies=len(strategy_results)))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", format_slider_for_display(synthesis, total_strategies=len(strategy_results)))
         
         # 5. Check if rebalance needed
         slider_change = abs(new_slider - self.current_slider)
         
         if slider_change >= self.min_slider_change:
-            logger.info(f"Slider change {slider_change:.2f} >= threshold, rebalancing...")
-            self._rebalance(new_slider, tqqq_price, sqqq_price)
+            logger.info("Slider change %.2f >= threshold, rebalancing...", slider_change)
+            self._rebalance(new_slider, prices)
             self.current_slider = new_slider
         else:
-            logger.info(f"Slider change {slider_change:.2f} < threshold, holding position")
+            logger.info("Slider change %.2f < threshold, holding position", slider_change)
         
         # 6. Calculate current PnL and Compare
         # Use valid prices fetched earlier
         total_value = self.position.get_total_value(tqqq_price, sqqq_price)
         pnl = total_value - self.demo_pool
         pnl_pct = (pnl / self.demo_pool) * 100
+        self._last_state = {
+            "tqqq_price": tqqq_price,
+            "sqqq_price": sqqq_price,
+            "total_value": total_value,
+            "ts": time.monotonic(),
+        }
         
         # Log Performance Comparison
-        logger.info("\n" + self.benchmark_tracker.format_comparison(total_value))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", self.benchmark_tracker.format_comparison(total_value))
         
         # 6. Save to history
-        self.history.add(
+        entry = self.history.add(
             timestamp=cycle_start,
             slider=new_slider,
             confidence=confidence,
             strategy_results={k: v.get("slider", 0) for k, v in strategy_results.items()},
             pnl=pnl,
         )
-        self.history.save(self.history_path)
+        _IO_EXECUTOR.submit(self._append_history, self.history, entry)
         
-        # 7. Materialize to KB
+        # 7. Materialize to KB (in the background)
         action_taken = self._infer_action(new_slider) if slider_change >= self.min_slider_change else "HOLD"
-        try:
-            self.kb_writer.append_decision(
-                strategy_results=strategy_results,
-                synthesis_result=synthesis,
-                current_price=market_data.get('current_price', 0),
-                action_taken=action_taken,
-                bot_pnl_pct=pnl_pct,
-                benchmark_data=self.benchmark_tracker.get_performance(),
-                sqqq_price=sqqq_price,
-            )
-        except Exception as e:
-            logger.warning(f"KB materialization failed: {e}")
+        _IO_EXECUTOR.submit(
+            self._append_kb_decision,
+            strategy_results=strategy_results,
+            synthesis_result=synthesis,
+            current_price=prices["QQQ"],
+            action_taken=action_taken,
+            bot_pnl_pct=pnl_pct,
+            benchmark_data=self.benchmark_tracker.get_performance(),
+            sqqq_price=sqqq_price,
+        )
         
         # 8. Write status file for UI
         self._write_status_file(
             cycle_start, new_slider, confidence, pnl, pnl_pct, 
-            total_value, market_data, strategy_results, synthesis
+            total_value, prices, strategy_results, synthesis
         )
 
         return {
@@ -263,12 +412,46 @@ class SliderBot:
             "total_value": total_value,
         }
     
+    def _append_history(self, history: SliderHistory, entry: Dict):
+        """Append a history entry to disk (runs on the I/O worker)."""
+        try:
+            history.append(self.history_path, entry)
+        except Exception as e:
+            logger.warning(f"Failed to append history: {e}")
+    
+    def _append_kb_decision(self, **kwargs):
+        """Materialize a decision to the KB (runs on the I/O worker)."""
+        try:
+            self.kb_writer.append_decision(**kwargs)
+        except Exception as e:
+            logger.warning(f"KB materialization failed: {e}")
+    
+    def _flush_io(self):
+        """Block until all queued KB/history writes have finished."""
+        _IO_EXECUTOR.submit(lambda: None).result()
+    
     def _write_status_file(
         self, timestamp: datetime, slider: float, confidence: float,
         pnl: float, pnl_pct: float, total_value: float,
-        market_data: Dict, strategy_results: Dict, synthesis: Dict
+        prices: Dict[str, float], strategy_results: Dict, synthesis: Dict,
+        force: bool = False,
     ):
-        """Write current status to JSON for UI consumption."""
+        """
+        Write current status to JSON for UI consumption.
+
+        Skipped when slider, confidence, PnL, total value, action and the
+        QQQ price (which drives the benchmarks) are unchanged since the
+        last write, unless force is set.
+        """
+        action = self._infer_action(slider)
+        status_hash = hash((
+            round(slider, 4), round(confidence, 4), round(pnl, 2),
+            round(total_value, 2), action, round(prices.get("QQQ", 0), 2),
+        ))
+        if status_hash == self._last_status_hash and not force:
+            logger.debug("Status unchanged, skipping status file write")
+            return
+        
         try:
             status_file = Path("kb/slider_status.json")
             status_file.parent.mkdir(parents=True, exist_ok=True)
@@ -277,11 +460,12 @@ class SliderBot:
             strategies = []
             for name, res in strategy_results.items():
                 if not res.get("success"): continue
+                reasoning = res.get("reasoning", "")
                 strategies.append({
                     "name": name,
                     "slider": res.get("slider", 0),
                     "confidence": res.get("confidence", 0),
-                    "reasoning": res.get("reasoning", "")[:100] + "..." if len(res.get("reasoning", "")) > 100 else res.get("reasoning", ""),
+                    "reasoning": reasoning[:100] + "..." if len(reasoning) > 100 else reasoning,
                     "direction": res.get("direction", "neutral")
                 })
             
@@ -301,31 +485,32 @@ class SliderBot:
                     "total_value": total_value,
                 },
                 "market": {
-                    "current_price": market_data.get("current_price", 0),
+                    "current_price": prices.get("QQQ", 0),
                     # Get session directly from data_feed if possible, or re-fetch
                     "session": get_market_session()["session_name"]
                 },
                 "strategies": strategies,
                 "benchmarks": benchmarks,
-                "action": self._infer_action(slider),
+                "action": action,
                 "agreement": synthesis.get("strategy_agreement", 0),
             }
             
-            with open(status_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            _write_atomic(status_file, fast_json.dumps(data, indent=True))
+            self._last_status_hash = status_hash
                 
         except Exception as e:
             logger.error(f"Failed to write status file: {e}")
     
-    def _rebalance(self, target_slider: float, tqqq_price: float, sqqq_price: float):
+    def _rebalance(self, target_slider: float, prices: Dict[str, float]):
         """
         Rebalance demo portfolio to match target slider.
 
         Args:
             target_slider: Target slider (-1 to +1)
-            tqqq_price: Current TQQQ price
-            sqqq_price: Current SQQQ price
+            prices: Cycle prices (uses TQQQ and SQQQ)
         """
+        tqqq_price = prices.get(TQQQ_SYMBOL, 0)
+        sqqq_price = prices.get(SQQQ_SYMBOL, 0)
         if tqqq_price <= 0 or sqqq_price <= 0:
             logger.error("Cannot rebalance: invalid prices")
             return
@@ -373,46 +558,103 @@ class SliderBot:
         logger.info(f"[DEMO] Rebalance complete: {tqqq_target_shares:.4f} TQQQ, {sqqq_target_shares:.4f} SQQQ")
     
     def _get_price(self, symbol: str) -> float:
-        """Get current price for symbol with 3-tier resolution.
+        """Get current price for a single symbol (see _get_prices)."""
+        return self._get_prices([symbol]).get(symbol, 0.0)
 
-        Price resolution order (outside regular hours):
+    def _get_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Get current prices for several symbols in one quote request.
+
+        Price resolution order per symbol (outside regular hours):
         1. last_extended_hours_trade_price (available ~4:00-20:00 ET)
         2. bid/ask midpoint (available during 24hr market for eligible ETFs)
         3. last_trade_price (regular session close — final fallback)
 
         During regular hours (09:30-16:00), uses last_trade_price directly.
+        Symbols that fail to resolve map to 0.0. Prices fetched within
+        PRICE_CACHE_TTL_SECONDS are served from memory.
         """
+        prices = {}
+        missing = []
+        now_mono = time.monotonic()
+        for symbol in symbols:
+            cached = self._price_cache.get(symbol)
+            if cached and now_mono - cached[1] < PRICE_CACHE_TTL_SECONDS:
+                prices[symbol] = cached[0]
+            else:
+                prices[symbol] = 0.0
+                missing.append(symbol)
+
+        if not missing:
+            return prices
+
         try:
-            import robin_stocks.robinhood as rh
-            quote = rh.stocks.get_stock_quote_by_symbol(symbol)
+            quotes = _GET_QUOTES(missing) or []
+        except Exception as e:
+            logger.warning(f"Failed to get prices for {missing}: {e}")
+            return prices
 
-            # Check if we're in extended hours
+        is_extended_hours = self._is_extended_hours()
+
+        for quote in quotes:
+            if not quote:
+                continue
+            symbol = quote.get('symbol')
+            if symbol not in prices:
+                continue
+            try:
+                price = self._resolve_quote_price(symbol, quote, is_extended_hours)
+            except Exception as e:
+                logger.warning(f"Failed to get price for {symbol}: {e}")
+                continue
+            prices[symbol] = price
+            if price > 0:
+                self._price_cache[symbol] = (price, now_mono)
+
+        return prices
+
+    def _prune_price_cache(self, max_age: float):
+        """Drop cached quotes older than max_age seconds."""
+        now_mono = time.monotonic()
+        for symbol, (_, fetched_at) in list(self._price_cache.items()):
+            if now_mono - fetched_at >= max_age:
+                self._price_cache.pop(symbol, None)
+
+    def _is_extended_hours(self) -> bool:
+        """Check if now is outside regular hours (09:30-16:00 ET).
+
+        The day's open/close are converted to epoch seconds once per ET
+        calendar day, so the per-call check is a float compare.
+        """
+        now_ts = time.time()
+        open_ts, close_ts, valid_until = self._session_bounds
+        if now_ts >= valid_until:
             now = datetime.now(self.et_tz)
-            market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-            market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
-            is_extended_hours = now < market_open or now > market_close
-
-            if is_extended_hours:
-                # Tier 1: Extended hours trade price (works ~4:00-20:00 ET)
-                extended_price = quote.get('last_extended_hours_trade_price')
-                if extended_price:
-                    price = float(extended_price)
-                    if price > 0:
-                        return price
-
-                # Tier 2: Bid/ask midpoint (24hr market may keep bid/ask alive)
-                bid = float(quote.get('bid_price', 0) or 0)
-                ask = float(quote.get('ask_price', 0) or 0)
-                if bid > 0 and ask > 0:
-                    midpoint = (bid + ask) / 2
-                    logger.debug(f"{symbol} using bid/ask midpoint ${midpoint:.2f} (bid=${bid:.2f}, ask=${ask:.2f})")
-                    return midpoint
-
-            # Tier 3 / Regular hours: last trade price
-            return float(quote.get('last_trade_price', 0))
-        except Exception as e:
-            logger.warning(f"Failed to get price for {symbol}: {e}")
-            return 0.0
+            open_ts = now.replace(hour=9, minute=30, second=0, microsecond=0).timestamp()
+            close_ts = now.replace(hour=16, minute=0, second=0, microsecond=0).timestamp()
+            end_of_day = now.replace(hour=23, minute=59, second=59, microsecond=999999).timestamp()
+            self._session_bounds = (open_ts, close_ts, end_of_day)
+        return now_ts < open_ts or now_ts > close_ts
+
+    def _resolve_quote_price(self, symbol: str, quote: Dict, is_extended_hours: bool) -> float:
+        """Apply the 3-tier price resolution to a single quote."""
+        if is_extended_hours:
+            # Tier 1: Extended hours trade price (works ~4:00-20:00 ET)
+            extended_price = quote.get('last_extended_hours_trade_price')
+            if extended_price:
+                price = float(extended_price)
+                if price > 0:
+                    return price
+
+            # Tier 2: Bid/ask midpoint (24hr market may keep bid/ask alive)
+            bid = float(quote.get('bid_price', 0) or 0)
+            ask = float(quote.get('ask_price', 0) or 0)
+            if bid > 0 and ask > 0:
+                midpoint = (bid + ask) / 2
+                logger.debug(f"{symbol} using bid/ask midpoint ${midpoint:.2f} (bid=${bid:.2f}, ask=${ask:.2f})")
+                return midpoint
+
+        # Tier 3 / Regular hours: last trade price
+        return float(quote.get('last_trade_price', 0) or 0)
     
     def _is_tradable_hours(self, session: Dict = None) -> Tuple[bool, str]:
         """
@@ -460,6 +702,12 @@ class SliderBot:
     def stop(self):
         """Stop the bot."""
         self.running = False
+        self._stop_evt.set()
+        try:
+            self._flush_io()
+            self.history.compact(self.history_path)
+        except Exception as e:
+            logger.warning(f"Failed to compact history file: {e}")
         logger.info("Stop requested")
 
     def reset(self, new_capital: float = None):
@@ -480,40 +728,36 @@ class SliderBot:
         self.position = DemoPosition(cash=capital)
         self.demo_pool = capital
         self.current_slider = 0.0
+        self._last_state = None
 
         # Reset benchmark tracker
         self.benchmark_tracker.reset(capital)
 
         # Immediately initialize benchmarks with current prices so returns start at 0%
-        qqq_price = 0
+        prices = {}
         try:
-            tqqq_price = self._get_price(TQQQ_SYMBOL)
-            qqq_price = self._get_price("QQQ")
-            voo_price = self._get_price("VOO")
+            prices = self._get_prices([TQQQ_SYMBOL, "QQQ", "VOO"])
+            tqqq_price = prices[TQQQ_SYMBOL]
+            qqq_price = prices["QQQ"]
+            voo_price = prices["VOO"]
 
             if tqqq_price > 0 and qqq_price > 0 and voo_price > 0:
-                self.benchmark_tracker.initialize({
-                    "TQQQ": tqqq_price,
-                    "QQQ": qqq_price,
-                    "VOO": voo_price,
-                })
+                self.benchmark_tracker.initialize(prices)
                 # Update with same prices so current_price matches start_price
-                self.benchmark_tracker.update({
-                    "TQQQ": tqqq_price,
-                    "QQQ": qqq_price,
-                    "VOO": voo_price,
-                })
+                self.benchmark_tracker.update(prices)
                 logger.info(f"Benchmarks initialized at TQQQ=${tqqq_price:.2f}, QQQ=${qqq_price:.2f}, VOO=${voo_price:.2f}")
         except Exception as e:
             logger.warning(f"Failed to initialize benchmarks on reset: {e}")
 
-        # Clear history
+        # Clear history (after any queued appends, so they can't recreate the file)
+        self._flush_io()
         self.history = SliderHistory()
-        if self.history_path.exists():
-            try:
-                self.history_path.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to delete history file: {e}")
+        for path in (self.history_path, self._legacy_history_path):
+            if path is not None and path.exists():
+                try:
+                    path.unlink()
+                except Exception as e:
+                    logger.warning(f"Failed to delete history file {path}: {e}")
 
         # Write fresh status file
         now = datetime.now(self.et_tz)
@@ -524,18 +768,35 @@ class SliderBot:
             pnl=0.0,
             pnl_pct=0.0,
             total_value=capital,
-            market_data={'current_price': qqq_price},
+            prices=prices,
             strategy_results={},
-            synthesis={'strategy_agreement': 0}
+            synthesis={'strategy_agreement': 0},
+            force=True,
         )
 
         logger.info(f"SliderBot reset complete. Capital: ${capital:,.2f}")
     
     def get_status(self) -> Dict:
-        """Get current bot status."""
-        tqqq_price = self._get_price(TQQQ_SYMBOL)
-        sqqq_price = self._get_price(SQQQ_SYMBOL)
-        total_value = self.position.get_total_value(tqqq_price, sqqq_price)
+        """
+        Get current bot status.
+
+        Reuses the last cycle's prices if they are fresher than
+        STATUS_CACHE_TTL_SECONDS, so status polls between cycles
+        don't hit Robinhood.
+        """
+        state = self._last_state
+        if state is None or time.monotonic() - state["ts"] >= STATUS_CACHE_TTL_SECONDS:
+            prices = self._get_prices([TQQQ_SYMBOL, SQQQ_SYMBOL])
+            tqqq_price = prices[TQQQ_SYMBOL]
+            sqqq_price = prices[SQQQ_SYMBOL]
+            state = {
+                "tqqq_price": tqqq_price,
+                "sqqq_price": sqqq_price,
+                "total_value": self.position.get_total_value(tqqq_price, sqqq_price),
+                "ts": time.monotonic(),
+            }
+            self._last_state = state
+        total_value = state["total_value"]
         
         return {
             "running": self.running,
@@ -548,24 +809,19 @@ class SliderBot:
             "total_value": total_value,
             "pnl": total_value - self.demo_pool,
             "pnl_pct": ((total_value - self.demo_pool) / self.demo_pool) * 100,
+            "last_updated_ts": state["ts"],
         }
     
     def _infer_action(self, final_slider: float) -> str:
         """Infer action description from final slider value."""
-        if final_slider > 0.5:
-            return f"STRONG BUY TQQQ {abs(final_slider)*100:.0f}%"
-        elif final_slider > 0.1:
-            return f"BUY TQQQ {abs(final_slider)*100:.0f}%"
-        elif final_slider > 0.05:
-            return f"LIGHT TQQQ {abs(final_slider)*100:.0f}%"
-        elif final_slider < -0.5:
-            return f"STRONG BUY SQQQ {abs(final_slider)*100:.0f}%"
-        elif final_slider < -0.1:
-            return f"BUY SQQQ {abs(final_slider)*100:.0f}%"
-        elif final_slider < -0.05:
-            return f"LIGHT SQQQ {abs(final_slider)*100:.0f}%"
+        # Band edges are exclusive on both sides of NEUTRAL (e.g. exactly 0.5 is BUY, not STRONG BUY)
+        if final_slider > 0:
+            idx = bisect.bisect_left(_ACTION_THRESHOLDS, final_slider)
         else:
+            idx = bisect.bisect_right(_ACTION_THRESHOLDS, final_slider)
+        if idx == _NEUTRAL_INDEX:
             return "NEUTRAL"
+        return f"{_ACTION_LABELS[idx]} {abs(final_slider)*100:.0f}%"
 
 
 def run_demo(dry_run: bool = False, with_ui: bool = True):
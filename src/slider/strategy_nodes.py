@@ -11,18 +11,73 @@ Adding a new strategy:
   2. Add an entry to STRATEGY_REGISTRY below
 """
 
-import json
+import asyncio
+import atexit
+import copy
+import functools
+import hashlib
 import logging
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.api import ai
+from src.utils import fast_json
+from . import semantic_cache
+from .response_cache import DiskResponseCache
+from .data_feed import get_market_session
+from .prompting import PROMPTS_DIR, compile_prompt, load_prompt, render_prompt, strip_fences
 
 logger = logging.getLogger(__name__)
 
-# Path to prompts directory
-PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts"
+# Per-tick fields worth embedding for the semantic cache: "- Name: value"
+# bullets and "**Name:** value" lines, plus intraday table rows
+_FIELD_LINE_RE = re.compile(r"^(?:- |\*\*)([^:*\n]+):(?:\*\*)? *([^*\s].*)$", re.M)
+_TABLE_ROW_RE = re.compile(r"^\| (\d\d:\d\d) \|(.+)\|$", re.M)
+# Fields that are prose, or change every tick without meaning anything
+_SUMMARY_SKIP_FIELDS = frozenset({
+    "Timestamp", "Time Window", "Character", "Kelly Sizing", "Best Strategies",
+})
+EMBED_RECENT_BARS = 3
+
+# Exact-match cache of raw LLM responses, keyed on (prompt_file, prompt hash)
+LLM_CACHE_MAX_ENTRIES = 512
+LLM_CACHE_TTL_SECONDS = 60
+_llm_cache: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+# Same responses persisted across restarts; opt-in with SLIDER_DISK_CACHE=1
+DISK_CACHE_ENABLED = os.environ.get("SLIDER_DISK_CACHE", "0") == "1"
+_disk_cache = DiskResponseCache(PROMPTS_DIR / ".cache" / "strategy_cache.sqlite")
+
+# Results of the previous run, reused when the next run has identical inputs
+LAST_RUN_TTL_SECONDS = 30
+_last_run: Dict = {"key": None, "time": 0.0, "results": None}
+_last_run_lock = threading.Lock()
+
+# Stream responses and stop reading once the JSON object closes (opt-in)
+STREAMING_ENABLED = os.environ.get("SLIDER_STREAMING") == "1"
+
+# Fast/default model cascade (active when the provider's *_FAST_MODEL_NAME is set)
+CASCADE_ACCEPT_CONFIDENCE = 0.3
+# Share of the round's remaining time the fast tier may use, and the least
+# time worth starting an escalation with
+CASCADE_FAST_SHARE = 0.3
+CASCADE_MIN_ESCALATION_SECONDS = 10
+_cascade_stats = {"accepted": 0, "escalated": 0, "out_of_time": 0}
+_cascade_lock = threading.Lock()
+
+# Send all strategies in one LLM request instead of one request each (opt-in)
+BATCH_MODE_ENABLED = os.environ.get("SLIDER_BATCH_MODE") == "1"
+
+# Similarity cache of parsed results per prompt file (opt-in, needs sentence-transformers)
+SEMANTIC_CACHE_ENABLED = os.environ.get("SLIDER_SEMANTIC_CACHE") == "1"
+_semantic_caches: Dict[str, semantic_cache.SemanticCache] = {}
+_semantic_caches_lock = threading.Lock()
 
 
 # =============================================================================
@@ -69,24 +124,222 @@ STRATEGY_REGISTRY: Dict[str, Dict] = {
     },
 }
 
+# Lookups derived once from the registry
+_ALL_NAMES = frozenset(STRATEGY_REGISTRY)
+_CONTEXT_KEYS: Dict[str, Tuple[str, ...]] = {
+    name: tuple(config.get("extra_context_keys", ()))
+    for name, config in STRATEGY_REGISTRY.items()
+}
+
+
+# Wall-clock budget for one round of strategy calls (also the HTTP timeout)
+STRATEGY_TIMEOUT_SECONDS = 60
+# HTTP timeouts end this long before the round deadline, so a call that
+# times out is reported as an error rather than abandoned
+DEADLINE_MARGIN_SECONDS = 1.0
+
+# Shared worker pool so each tick reuses warm threads
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(8, len(STRATEGY_REGISTRY)),
+    thread_name_prefix="strategy",
+)
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
 
 # =============================================================================
 # CORE ENGINE (no changes needed when adding strategies)
 # =============================================================================
 
-def _load_prompt(filename: str) -> str:
-    """Load prompt template from file."""
-    path = PROMPTS_DIR / filename
-    if not path.exists():
-        logger.error(f"Prompt file not found: {path}")
-        return ""
-    return path.read_text(encoding='utf-8')
+def _hash_prompt(prompt: str) -> str:
+    """Short, stable digest of a fully rendered prompt."""
+    return hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _llm_cache_get(key: Tuple[str, str]) -> Optional[str]:
+    """Return a cached raw response if present and not expired."""
+    with _llm_cache_lock:
+        hit = _llm_cache.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] >= LLM_CACHE_TTL_SECONDS:
+            del _llm_cache[key]
+            return None
+        _llm_cache.move_to_end(key)
+        return hit[1]
+
+
+def _llm_cache_put(key: Tuple[str, str], raw: str, requested_at: float):
+    """Store a raw response, evicting the least recently used entries."""
+    with _llm_cache_lock:
+        _llm_cache[key] = (requested_at, raw)
+        _llm_cache.move_to_end(key)
+        while len(_llm_cache) > LLM_CACHE_MAX_ENTRIES:
+            _llm_cache.popitem(last=False)
+
+
+def _lookup_response(key: Tuple[str, str]) -> Optional[str]:
+    """Check the in-memory cache, then the disk cache (promoting disk hits)."""
+    raw = _llm_cache_get(key)
+    if raw is None and DISK_CACHE_ENABLED:
+        raw = _disk_cache.get(":".join(key))
+        if raw is not None:
+            _llm_cache_put(key, raw, time.monotonic())
+    return raw
+
+
+def _store_response(key: Tuple[str, str], raw: str, requested_at: float):
+    """Write a fresh response to the in-memory and disk caches."""
+    _llm_cache_put(key, raw, requested_at)
+    if DISK_CACHE_ENABLED:
+        _disk_cache.put(":".join(key), raw)
+
+
+def _parse_and_store(
+    prompt_file: str,
+    key: Tuple[str, str],
+    raw: str,
+    requested_at: float,
+    parse: Callable[[str], Any],
+) -> Any:
+    """
+    Parse a fresh response and cache it only if parsing succeeded.
+
+    A reply that parse() rejects (by raising, or by returning a result with
+    success=False) is never replayed from the cache. A batched result maps
+    strategy names to results and is kept only if every one of them parsed.
+    """
+    logger.info("[%s] LLM response (%d chars): %.200s...", prompt_file, len(raw), raw)
+    result = parse(raw)
+    if "success" in result:
+        parsed = result["success"]
+    else:
+        parsed = all(r["success"] for r in result.values())
+    if parsed:
+        _store_response(key, raw, requested_at)
+    return result
+
+
+def _cached_llm_call(
+    prompt_file: str,
+    prompt_hash: str,
+    prefix: str,
+    suffix: str,
+    parse: Callable[[str], Any],
+    model: Optional[str] = None,
+    timeout: float = STRATEGY_TIMEOUT_SECONDS,
+) -> Any:
+    """
+    Return parse() of the LLM response for a prompt, reusing a recent
+    identical call.
+
+    In memory, entries expire after LLM_CACHE_TTL_SECONDS and the least
+    recently used entry is evicted once LLM_CACHE_MAX_ENTRIES is reached.
+    With SLIDER_DISK_CACHE=1 responses are also kept on disk so they survive
+    restarts. Failed requests and replies that don't parse are never
+    cached. model overrides the provider's configured model and is part of
+    the cache key.
+    """
+    key = (f"{prompt_file}@{model}" if model else prompt_file, prompt_hash)
+    raw = _lookup_response(key)
+    if raw is not None:
+        logger.info("[%s] LLM cache hit", prompt_file)
+        return parse(raw)
+
+    # Lock is not held across the network call so other strategies proceed
+    requested_at = time.monotonic()
+    if STREAMING_ENABLED:
+        raw = ai.make_ai_request_streamed_json(prefix, suffix, timeout=timeout, model=model)
+    else:
+        response = ai.make_ai_request_cached(prefix, suffix, timeout=timeout, model=model)
+        raw = ai.get_raw_response_content(response)
+    return _parse_and_store(prompt_file, key, raw, requested_at, parse)
+
+
+async def _cached_llm_call_async(
+    prompt_file: str,
+    prompt_hash: str,
+    prefix: str,
+    suffix: str,
+    parse: Callable[[str], Any],
+) -> Any:
+    """Async counterpart of _cached_llm_call sharing the same cache."""
+    key = (prompt_file, prompt_hash)
+    raw = _lookup_response(key)
+    if raw is not None:
+        logger.info("[%s] LLM cache hit", prompt_file)
+        return parse(raw)
+
+    requested_at = time.monotonic()
+    response = await ai.make_ai_request_cached_async(prefix, suffix, timeout=STRATEGY_TIMEOUT_SECONDS)
+    raw = ai.get_raw_response_content(response)
+    return _parse_and_store(prompt_file, key, raw, requested_at, parse)
+
+
+def _embedding_summary(suffix: str) -> str:
+    """
+    Compact digest of a prompt's per-tick data for the semantic cache.
+
+    The prefix is constant per prompt file, so only the suffix tells ticks
+    apart. The embedding model stops reading after 256 tokens, which the
+    raw suffix passes before its indicators, so this keeps the price and
+    indicator values first, then the most recent bars (the table is newest
+    first), and drops the prose.
+    """
+    fields = [
+        f"{name.strip()} {value.replace('$', '').strip()}"
+        for name, value in _FIELD_LINE_RE.findall(suffix)
+        if name.strip() not in _SUMMARY_SKIP_FIELDS
+    ]
+    bars = [
+        f"{time_str} " + " ".join(cells.replace("|", " ").split())
+        for time_str, cells in _TABLE_ROW_RE.findall(suffix)[:EMBED_RECENT_BARS]
+    ]
+    return "; ".join(fields + bars)
+
+
+def _get_semantic_cache(prompt_file: str) -> Optional[semantic_cache.SemanticCache]:
+    """Return the semantic cache for a prompt file, or None when disabled."""
+    if not SEMANTIC_CACHE_ENABLED:
+        return None
+    with _semantic_caches_lock:
+        cache = _semantic_caches.get(prompt_file)
+        if cache is None:
+            cache = _semantic_caches[prompt_file] = semantic_cache.SemanticCache()
+        return cache
+
+
+def _build_prompt(
+    prompt_file: str,
+    market_data: str,
+    extra_context: Optional[Dict[str, str]],
+) -> Optional[Tuple[str, str]]:
+    """Render a strategy prompt as (prefix, suffix), or None if the file is missing."""
+    prefix, suffix_template = load_prompt(prompt_file)
+    if not prefix and not suffix_template:
+        return None
+    
+    # Inject market data and any extra context placeholders (suffix only)
+    values = {"market_data": market_data}
+    if extra_context:
+        values.update(extra_context)
+    suffix = render_prompt(compile_prompt(suffix_template), values)
+    
+    # Log the full prompt being sent to LLM
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[%s] Full prompt:\n%s%s", prompt_file, prefix, suffix)
+    elif logger.isEnabledFor(logging.INFO):
+        # Truncated per-tick part only; the prefix is the same every call
+        prompt_preview = suffix[:500] + "..." if len(suffix) > 500 else suffix
+        logger.info("[%s] Input prompt (%d chars), preview:\n%s",
+                    prompt_file, len(prefix) + len(suffix), prompt_preview)
+    return prefix, suffix
 
 
 def _run_strategy_llm(
     prompt_file: str,
     market_data: str,
-    extra_context: Dict[str, str] = None
+    extra_context: Dict[str, str] = None,
+    deadline: Optional[float] = None,
 ) -> Dict:
     """
     Run a single strategy through LLM.
@@ -95,34 +348,127 @@ def _run_strategy_llm(
         prompt_file: Prompt template filename
         market_data: Formatted market data string
         extra_context: Additional context to inject (e.g., opening_range, gap_info)
+        deadline: time.monotonic() by which the result is needed
+            (default: STRATEGY_TIMEOUT_SECONDS from now)
     
     Returns:
         Dict with slider, confidence, direction, reasoning
     """
-    prompt_template = _load_prompt(prompt_file)
-    if not prompt_template:
+    parts = _build_prompt(prompt_file, market_data, extra_context)
+    if parts is None:
         return _default_output("Prompt file not found")
+    prefix, suffix = parts
+    prompt = prefix + suffix
     
-    # Inject market data
-    prompt = prompt_template.replace("{market_data}", market_data)
+    try:
+        cache = _get_semantic_cache(prompt_file)
+        embedding = semantic_cache.embed(_embedding_summary(suffix)) if cache is not None else None
+        if embedding is not None:
+            cached = cache.lookup(embedding)
+            if cached is not None:
+                logger.info("[%s] Semantic cache hit", prompt_file)
+                return cached
+        
+        if deadline is None:
+            deadline = time.monotonic() + STRATEGY_TIMEOUT_SECONDS
+        result = _run_cascade(prompt_file, _hash_prompt(prompt), prefix, suffix, deadline)
+        if embedding is not None and result["success"]:
+            cache.add(embedding, result)
+        return result
+    except Exception as e:
+        logger.error(f"Strategy LLM failed ({prompt_file}): {e}")
+        return _default_output(f"LLM error: {e}")
+
+
+def _call_and_parse(
+    prompt_file: str,
+    prompt_hash: str,
+    prefix: str,
+    suffix: str,
+    model: Optional[str] = None,
+    timeout: float = STRATEGY_TIMEOUT_SECONDS,
+) -> Dict:
+    """One (cached) LLM call, parsed into a strategy result."""
+    return _cached_llm_call(
+        prompt_file, prompt_hash, prefix, suffix, _parse_strategy_output, model, timeout
+    )
+
+
+def _time_left(deadline: float) -> float:
+    """Seconds an HTTP call may take and still finish before deadline."""
+    return max(0.0, deadline - time.monotonic() - DEADLINE_MARGIN_SECONDS)
+
+
+def _run_cascade(
+    prompt_file: str,
+    prompt_hash: str,
+    prefix: str,
+    suffix: str,
+    deadline: float,
+) -> Dict:
+    """
+    Ask the fast model first when one is configured, escalating to the
+    default model unless it returns a clean, low-confidence answer.
     
-    # Inject any extra context placeholders
-    if extra_context:
-        for key, value in extra_context.items():
-            prompt = prompt.replace(f"{{{key}}}", value)
+    Most ticks are non-events where a strategy reports little or no edge;
+    those stop at the fast tier. Anything with conviction, a parse failure
+    or an error goes to the default model.
     
-    # Log the full prompt being sent to LLM
-    logger.info(f"[{prompt_file}] Input prompt ({len(prompt)} chars):")
-    logger.debug(f"[{prompt_file}] Full prompt:\n{prompt}")
-    # Also log a truncated version at INFO level for visibility
-    prompt_preview = prompt[:500] + "..." if len(prompt) > 500 else prompt
-    logger.info(f"[{prompt_file}] Prompt preview:\n{prompt_preview}")
+    Both calls share the time left before deadline: the fast tier gets
+    CASCADE_FAST_SHARE of it, the escalation whatever remains. With less
+    than CASCADE_MIN_ESCALATION_SECONDS left the fast answer stands (or a
+    neutral default if there is none).
+    """
+    if _time_left(deadline) <= 0:
+        # Started too late to finish before the round gives up on it
+        logger.warning("[%s] No time left before the round deadline, skipping", prompt_file)
+        return _default_output("No time left")
+    
+    if not ai.fast_model_name:
+        return _call_and_parse(prompt_file, prompt_hash, prefix, suffix, timeout=_time_left(deadline))
     
     try:
-        response = ai.make_ai_request(prompt)
-        raw = ai.get_raw_response_content(response)
-        logger.info(f"[{prompt_file}] LLM response ({len(raw)} chars): {raw[:200]}...")
-        return _parse_strategy_output(raw)
+        fast = _call_and_parse(
+            prompt_file, prompt_hash, prefix, suffix, ai.fast_model_name,
+            timeout=_time_left(deadline) * CASCADE_FAST_SHARE,
+        )
+    except Exception as e:
+        logger.warning("[%s] Fast model failed, escalating: %s", prompt_file, e)
+        fast = None
+    
+    if fast is not None and fast["success"] and fast["confidence"] < CASCADE_ACCEPT_CONFIDENCE:
+        with _cascade_lock:
+            _cascade_stats["accepted"] += 1
+        return fast
+    
+    remaining = _time_left(deadline)
+    if remaining < CASCADE_MIN_ESCALATION_SECONDS:
+        with _cascade_lock:
+            _cascade_stats["out_of_time"] += 1
+        logger.warning("[%s] Only %.1fs left, not escalating", prompt_file, remaining)
+        return fast if fast is not None else _default_output("No time left to escalate")
+    
+    with _cascade_lock:
+        _cascade_stats["escalated"] += 1
+    logger.info("[%s] Escalating to default model", prompt_file)
+    return _call_and_parse(prompt_file, prompt_hash, prefix, suffix, timeout=remaining)
+
+
+async def _run_strategy_llm_async(
+    prompt_file: str,
+    market_data: str,
+    extra_context: Dict[str, str] = None
+) -> Dict:
+    """Async counterpart of _run_strategy_llm (exact-match cache only)."""
+    parts = _build_prompt(prompt_file, market_data, extra_context)
+    if parts is None:
+        return _default_output("Prompt file not found")
+    prefix, suffix = parts
+    
+    try:
+        return await _cached_llm_call_async(
+            prompt_file, _hash_prompt(prefix + suffix), prefix, suffix, _parse_strategy_output
+        )
     except Exception as e:
         logger.error(f"Strategy LLM failed ({prompt_file}): {e}")
         return _default_output(f"LLM error: {e}")
@@ -131,36 +477,59 @@ def _run_strategy_llm(
 def _parse_strategy_output(raw: str) -> Dict:
     """Parse LLM JSON output into strategy result."""
     try:
-        # Strip markdown code blocks if present
-        cleaned = raw.strip()
-        if cleaned.startswith("```"):
-            cleaned = cleaned.split("```")[1]
-            if cleaned.startswith("json"):
-                cleaned = cleaned[4:]
-        cleaned = cleaned.strip()
-        
-        result = json.loads(cleaned)
-        
-        # Validate and normalize
-        slider = float(result.get("slider", 0))
-        slider = max(-1.0, min(1.0, slider))  # Clamp to [-1, 1]
-        
-        confidence = float(result.get("confidence", 0))
-        confidence = max(0.0, min(1.0, confidence))  # Clamp to [0, 1]
-        
-        return {
-            "slider": slider,
-            "confidence": confidence,
-            "direction": result.get("direction", "neutral"),
-            "reasoning": result.get("reasoning", ""),
-            "mode": result.get("mode"),  # For gap trading
-            "success": True,
-        }
-    except (json.JSONDecodeError, ValueError) as e:
+        result = fast_json.loads(strip_fences(raw))
+        return _normalize_strategy_output(result)
+    except fast_json.JSONDecodeError as e:
         logger.warning(f"Failed to parse strategy output: {e}")
         return _default_output(f"Parse error: {e}")
 
 
+def _normalize_strategy_output(result: Dict) -> Dict:
+    """Validate and clamp one decoded strategy result."""
+    slider = float(result.get("slider", 0))
+    slider = max(-1.0, min(1.0, slider))  # Clamp to [-1, 1]
+    
+    confidence = float(result.get("confidence", 0))
+    confidence = max(0.0, min(1.0, confidence))  # Clamp to [0, 1]
+    
+    return {
+        "slider": slider,
+        "confidence": confidence,
+        "direction": result.get("direction", "neutral"),
+        "reasoning": result.get("reasoning", ""),
+        "mode": result.get("mode"),  # For gap trading
+        "success": True,
+    }
+
+
+def _parse_batched_output(raw: str, names: List[str]) -> Dict[str, Dict]:
+    """
+    Parse a batched LLM response of the form {"results": [{"strategy": ...}, ...]}.
+
+    Strategies missing from the response get a neutral default. Raises
+    ValueError if the response as a whole can't be decoded.
+    """
+    items = fast_json.loads(strip_fences(raw)).get("results")
+    if not isinstance(items, list):
+        raise ValueError("Batched response has no 'results' list")
+    
+    results = {}
+    for item in items:
+        name = item.get("strategy") if isinstance(item, dict) else None
+        if name not in names or name in results:
+            continue
+        try:
+            results[name] = _normalize_strategy_output(item)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Failed to parse batched output for {name}: {e}")
+            results[name] = _default_output(f"Parse error: {e}")
+    
+    for name in names:
+        if name not in results:
+            results[name] = _default_output("Missing from batched response")
+    return results
+
+
 def _default_output(error_msg: str = "") -> Dict:
     """Return neutral output on error."""
     return {
@@ -172,50 +541,224 @@ def _default_output(error_msg: str = "") -> Dict:
     }
 
 
+def _partition_by_session(strategies: Dict[str, Dict]) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """
+    Split strategies into those that should run now and neutral results for
+    those gated to a different session.
+    
+    The market session is looked up at most once, and only if some strategy
+    is gated.
+    """
+    if not any(config.get("session_gate") for config in strategies.values()):
+        return strategies, {}
+    
+    session_name = get_market_session()["session_name"]
+    to_run = {}
+    gated_out = {}
+    for name, config in strategies.items():
+        session_gate = config.get("session_gate")
+        if not session_gate or session_gate == session_name:
+            to_run[name] = config
+            continue
+        logger.info("Not in %s session (%s), %s returning neutral", session_gate, session_name, name)
+        gated_out[name] = {
+            "slider": 0.0,
+            "confidence": 0.0,
+            "direction": "neutral",
+            "reasoning": f"{name} inactive during {session_name} session",
+            "success": True,
+            "strategy": name,
+        }
+    return to_run, gated_out
+
+
 def _run_single_strategy(
     name: str,
     config: Dict,
     market_data: str,
     extra_context: Dict[str, str],
+    deadline: Optional[float] = None,
 ) -> Dict:
     """
     Run a single registered strategy.
     
-    Handles session gating and extra context extraction automatically.
+    Session gating is applied by the caller; this handles extra context
+    extraction.
     """
-    logger.info(f"Running {name} node...")
-    
-    # Session gating — return neutral if outside the required session
-    session_gate = config.get("session_gate")
-    if session_gate:
-        from .data_feed import get_market_session
-        session = get_market_session()
-        if session["session_name"] != session_gate:
-            logger.info(f"Not in {session_gate} session ({session['session_name']}), {name} returning neutral")
-            return {
-                "slider": 0.0,
-                "confidence": 0.0,
-                "direction": "neutral",
-                "reasoning": f"{name} inactive during {session['session_name']} session",
-                "success": True,
-                "strategy": name,
-            }
-    
-    # Extract only the extra context keys this strategy needs
-    strategy_context = {}
-    for key in config.get("extra_context_keys", []):
-        if key in extra_context:
-            strategy_context[key] = extra_context[key]
+    logger.info("Running %s node...", name)
     
     result = _run_strategy_llm(
         config["prompt_file"],
         market_data,
-        strategy_context or None,
+        _strategy_context(name, extra_context),
+        deadline,
     )
     result["strategy"] = name
     return result
 
 
+async def _run_single_strategy_async(
+    name: str,
+    config: Dict,
+    market_data: str,
+    extra_context: Dict[str, str],
+    semaphore: asyncio.Semaphore,
+) -> Dict:
+    """Async counterpart of _run_single_strategy."""
+    logger.info("Running %s node...", name)
+    
+    async with semaphore:
+        result = await _run_strategy_llm_async(
+            config["prompt_file"],
+            market_data,
+            _strategy_context(name, extra_context),
+        )
+    result["strategy"] = name
+    return result
+
+
+def _strategy_context(name: str, extra_context: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """Extract only the extra context keys a strategy needs."""
+    if not extra_context:
+        return None
+    strategy_context = {
+        key: extra_context[key] for key in _CONTEXT_KEYS[name] if key in extra_context
+    }
+    return strategy_context or None
+
+
+def _run_strategies_concurrent(
+    strategies: Dict[str, Dict],
+    market_data: str,
+    extra_context: Dict[str, str],
+) -> Dict[str, Dict]:
+    """Run each strategy as its own LLM request on the shared thread pool."""
+    results = {}
+    
+    # One deadline for the whole round, so a hung call can't stack timeouts
+    deadline = time.monotonic() + STRATEGY_TIMEOUT_SECONDS
+    futures = {
+        _EXECUTOR.submit(
+            _run_single_strategy, name, config, market_data, extra_context, deadline
+        ): name
+        for name, config in strategies.items()
+    }
+    
+    try:
+        for future in as_completed(futures, timeout=deadline - time.monotonic()):
+            strategy_name = futures[future]
+            try:
+                results[strategy_name] = future.result()
+            except Exception as e:
+                logger.error(f"  {strategy_name} failed: {e}")
+                results[strategy_name] = _default_output(str(e))
+                results[strategy_name]["strategy"] = strategy_name
+    except FuturesTimeoutError:
+        for future, strategy_name in futures.items():
+            if strategy_name in results:
+                continue
+            future.cancel()
+            logger.error(f"  {strategy_name} timed out after {STRATEGY_TIMEOUT_SECONDS}s")
+            results[strategy_name] = _default_output("timeout")
+            results[strategy_name]["strategy"] = strategy_name
+    
+    return results
+
+
+def _run_strategies_batched(
+    strategies: Dict[str, Dict],
+    market_data: str,
+    extra_context: Dict[str, str],
+) -> Dict[str, Dict]:
+    """
+    Run several strategies in a single LLM request.
+    
+    Each strategy's rulebook goes under a "## STRATEGY: <name>" header, followed
+    once by the shared market data and extra context. The model answers with
+    one JSON object holding a result per strategy.
+    
+    Raises if the request fails or the response can't be decoded, so the
+    caller can fall back to per-strategy requests.
+    """
+    sections = []
+    context_keys = []
+    for name, config in strategies.items():
+        prefix, _ = load_prompt(config["prompt_file"])
+        if not prefix:
+            raise ValueError(f"No cacheable rulebook in {config['prompt_file']}")
+        sections.append(f"## STRATEGY: {name}\n\n{prefix.strip()}\n")
+        for key in _CONTEXT_KEYS[name]:
+            if key in extra_context and key not in context_keys:
+                context_keys.append(key)
+    
+    names = list(strategies)
+    
+    prefix = (
+        "You will evaluate QQQ under each of the following independent strategies. "
+        "Apply each strategy's rules on its own; do not let one strategy influence another.\n\n"
+        + "\n".join(sections)
+    )
+    context = "".join(
+        f"\n## {key.replace('_', ' ').upper()}\n{extra_context[key]}\n" for key in context_keys
+    )
+    suffix = (
+        f"## MARKET DATA\n{market_data}\n{context}\n"
+        "Output ONLY this JSON, with exactly one entry per strategy above:\n"
+        '{"results": [{"strategy": "<name>", "slider": 0.0, "confidence": 0.0, '
+        '"direction": "neutral", "reasoning": "..."}]}\n'
+    )
+    
+    logger.info(f"Running {len(names)} strategies in one batched request ({len(prefix) + len(suffix)} chars)")
+    results = _cached_llm_call(
+        "batch:" + ",".join(names),
+        _hash_prompt(prefix + suffix),
+        prefix,
+        suffix,
+        functools.partial(_parse_batched_output, names=names),
+    )
+    for name, result in results.items():
+        result["strategy"] = name
+    return results
+
+
+def _select_strategies(active_strategies: Optional[List[str]]) -> Dict[str, Dict]:
+    """Resolve active strategy names against the registry. None = all registered."""
+    if active_strategies is None:
+        return STRATEGY_REGISTRY
+    
+    strategies = {
+        name: STRATEGY_REGISTRY[name]
+        for name in active_strategies
+        if name in STRATEGY_REGISTRY
+    }
+    # Warn about unknown strategy names
+    unknown = set(active_strategies) - _ALL_NAMES
+    if unknown:
+        logger.warning(f"Unknown strategies (skipped): {unknown}")
+    return strategies
+
+
+def _run_key(market_data: str, extra_context: Dict[str, str], strategy_names) -> bytes:
+    """Digest of everything that determines a run's results."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(market_data.encode('utf-8'))
+    for key in sorted(extra_context):
+        h.update(f"\x00{key}\x00{extra_context[key]}".encode('utf-8'))
+    h.update(("\x00" + ",".join(strategy_names)).encode('utf-8'))
+    return h.digest()
+
+
+def _log_results(results: Dict[str, Dict]):
+    """Log per-strategy outcomes and the success count."""
+    if logger.isEnabledFor(logging.INFO):
+        for name, result in results.items():
+            logger.info("  %s: slider=%.2f, confidence=%.2f",
+                        name, result['slider'], result['confidence'])
+    
+    succeeded = sum(1 for r in results.values() if r.get('success'))
+    logger.info("All strategies complete. %d/%d succeeded.", succeeded, len(results))
+
+
 # =============================================================================
 # PUBLIC API
 # =============================================================================
@@ -225,13 +768,36 @@ def get_registered_strategies() -> List[str]:
     return list(STRATEGY_REGISTRY.keys())
 
 
+def get_cascade_stats() -> Dict:
+    """Fast-tier accept/escalate counts (and escalations skipped for lack of time) since startup."""
+    with _cascade_lock:
+        stats = dict(_cascade_stats)
+    total = stats["accepted"] + stats["escalated"]
+    stats["escalation_rate"] = stats["escalated"] / total if total else 0.0
+    return stats
+
+
+def clear_strategy_cache():
+    """Drop all cached LLM responses (e.g. on a market session change)."""
+    with _llm_cache_lock:
+        _llm_cache.clear()
+    with _last_run_lock:
+        _last_run.update(key=None, results=None)
+    # The disk tier is left alone: its keys include the market data, so
+    # nothing carries over, and its TTL ages entries out
+    with _semantic_caches_lock:
+        for cache in _semantic_caches.values():
+            cache.clear()
+
+
 def run_strategy_nodes(
     market_data: str,
     extra_context: Dict[str, str] = None,
     active_strategies: List[str] = None,
 ) -> Dict[str, Dict]:
     """
-    Run strategy nodes concurrently.
+    Run strategy nodes concurrently, or as one batched request when
+    SLIDER_BATCH_MODE=1 (falling back to concurrent on failure).
     
     Args:
         market_data: Formatted market data string
@@ -242,69 +808,107 @@ def run_strategy_nodes(
         Dict mapping strategy name to result dict
     """
     extra_context = extra_context or {}
+    strategies = _select_strategies(active_strategies)
+    n = len(strategies)
     
-    # Determine which strategies to run
-    if active_strategies is not None:
-        strategies = {
-            name: STRATEGY_REGISTRY[name]
-            for name in active_strategies
-            if name in STRATEGY_REGISTRY
-        }
-        # Warn about unknown strategy names
-        unknown = set(active_strategies) - set(STRATEGY_REGISTRY.keys())
-        if unknown:
-            logger.warning(f"Unknown strategies (skipped): {unknown}")
-    else:
-        strategies = STRATEGY_REGISTRY
+    # Inputs identical to the last run: reuse its results without any LLM calls
+    run_key = _run_key(market_data, extra_context, strategies.keys())
+    with _last_run_lock:
+        if (_last_run["key"] == run_key
+                and time.monotonic() - _last_run["time"] < LAST_RUN_TTL_SECONDS):
+            logger.info("Market data unchanged, reusing results for %d strategy node(s)", n)
+            return copy.deepcopy(_last_run["results"])
     
-    n = len(strategies)
-    logger.info(f"Running {n} strategy node(s) concurrently: {list(strategies.keys())}")
+    # Gated-out strategies never reach the LLM or the pool
+    to_run, gated_out = _partition_by_session(strategies)
     
-    results = {}
+    run_results = None
+    if BATCH_MODE_ENABLED and len(to_run) > 1:
+        logger.info("Running %d strategy node(s) batched: %s", len(to_run), list(to_run))
+        try:
+            run_results = _run_strategies_batched(to_run, market_data, extra_context)
+        except Exception as e:
+            logger.warning(f"Batched strategy request failed, falling back to concurrent: {e}")
     
-    with ThreadPoolExecutor(max_workers=max(n, 1)) as executor:
-        futures = {
-            executor.submit(
-                _run_single_strategy, name, config, market_data, extra_context
-            ): name
-            for name, config in strategies.items()
-        }
-        
-        for future in as_completed(futures):
-            strategy_name = futures[future]
-            try:
-                result = future.result(timeout=60)
-                results[strategy_name] = result
-                logger.info(
-                    f"  {strategy_name}: slider={result['slider']:.2f}, "
-                    f"confidence={result['confidence']:.2f}"
-                )
-            except Exception as e:
-                logger.error(f"  {strategy_name} failed: {e}")
-                results[strategy_name] = _default_output(str(e))
-                results[strategy_name]["strategy"] = strategy_name
+    if run_results is None:
+        logger.info("Running %d strategy node(s) concurrently: %s", len(to_run), list(to_run))
+        run_results = _run_strategies_concurrent(to_run, market_data, extra_context)
     
-    succeeded = sum(1 for r in results.values() if r.get('success'))
-    logger.info(f"All strategies complete. {succeeded}/{n} succeeded.")
+    gated_out.update(run_results)
+    results = {name: gated_out[name] for name in strategies}
+    _log_results(results)
+    
+    # Only fully successful runs are worth replaying; failures should retry
+    if all(r.get('success') for r in results.values()):
+        with _last_run_lock:
+            _last_run.update(key=run_key, time=time.monotonic(), results=copy.deepcopy(results))
     return results
 
 
+async def run_strategy_nodes_async(
+    market_data: str,
+    extra_context: Dict[str, str] = None,
+    active_strategies: List[str] = None,
+    max_concurrency: int = 8,
+) -> Dict[str, Dict]:
+    """
+    Run strategy nodes on the current event loop.
+    
+    Same inputs and results as run_strategy_nodes, for callers that already
+    run inside asyncio. At most max_concurrency requests are in flight.
+    """
+    extra_context = extra_context or {}
+    strategies = _select_strategies(active_strategies)
+    logger.info("Running %d strategy node(s) async: %s", len(strategies), list(strategies))
+    
+    to_run, results = _partition_by_session(strategies)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    names = list(to_run)
+    outcomes = await asyncio.gather(
+        *(
+            asyncio.wait_for(
+                _run_single_strategy_async(name, config, market_data, extra_context, semaphore),
+                timeout=STRATEGY_TIMEOUT_SECONDS,
+            )
+            for name, config in to_run.items()
+        ),
+        return_exceptions=True,
+    )
+    
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"  {name} failed: {outcome!r}")
+            outcome = _default_output(str(outcome) or type(outcome).__name__)
+            outcome["strategy"] = name
+        results[name] = outcome
+    results = {name: results[name] for name in strategies}
+    
+    _log_results(results)
+    return results
+
+
+_SYNTH_TABLE_HEADER = (
+    "| Strategy | Slider | Confidence | Direction | Reasoning |\n"
+    "|----------|--------|------------|-----------|-----------|"
+)
+
+
 def format_strategy_outputs_for_synthesizer(results: Dict[str, Dict]) -> str:
     """Format strategy results for the synthesizer prompt.
 
     Strategy prompts are configured to output ≤80 char reasoning with abbreviations.
     No truncation here — synthesizer receives full reasoning.
     """
-    lines = ["| Strategy | Slider | Confidence | Direction | Reasoning |",
-             "|----------|--------|------------|-----------|-----------|"]
+    lines = [_SYNTH_TABLE_HEADER]
+    append = lines.append
 
     for name, result in results.items():
-        slider = f"{result.get('slider', 0):+.2f}"
-        conf = f"{result.get('confidence', 0):.0%}"
-        direction = result.get('direction', 'neutral')
-        reasoning = result.get('reasoning', '') or '-'
+        get = result.get
         # Escape pipe chars for markdown table
-        reasoning = reasoning.replace('|', '\\|')
-        lines.append(f"| {name} | {slider} | {conf} | {direction} | {reasoning} |")
+        reasoning = (get('reasoning') or '-').replace('|', '\\|')
+        append(
+            f"| {name} | {get('slider', 0):+.2f} | {get('confidence', 0):.0%} "
+            f"| {get('direction', 'neutral')} | {reasoning} |"
+        )
 
     return "\n".join(lines)
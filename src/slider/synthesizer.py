@@ -7,29 +7,110 @@ NO formula-based voting or weighted averaging — pure AI reasoning.
 Fallback: Simple weighted average (emergency only).
 """
 
-import json
 import logging
-from datetime import datetime
-from pathlib import Path
-from typing import Dict
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
-from pytz import timezone
+import numpy as np
 
 from src.api import deepseek
+from src.utils import fast_json
+from .data_feed import get_market_session
+from .prompting import compile_prompt, load_prompt, render_prompt, strip_fences
+from .strategy_nodes import format_strategy_outputs_for_synthesizer
 
 logger = logging.getLogger(__name__)
 
-# Path to prompts directory
-PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts"
+# Reuse of recent syntheses whose strategy signals match after rounding
+SYNTHESIS_CACHE_MAX_ENTRIES = 64
+SYNTHESIS_CACHE_TTL_SECONDS = 300
+SYNTHESIS_CACHE_STEP = 0.05
+_synthesis_cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+_synthesis_cache_lock = threading.Lock()
 
+# Fields of the formatted market data that set the coarse regime bucket
+_PRICE_RE = re.compile(r"^\*\*QQQ Current Price:\*\* \$([\d.]+)", re.M)
+_VWAP_RE = re.compile(r"^- VWAP: \$([\d.]+)", re.M)
+_RSI_RE = re.compile(r"^- RSI\(14\): ([\d.]+)", re.M)
 
-def _load_synthesizer_prompt() -> str:
-    """Load synthesizer prompt template."""
-    path = PROMPTS_DIR / "slider_synthesizer.md"
-    if not path.exists():
-        logger.error(f"Synthesizer prompt not found: {path}")
-        return ""
-    return path.read_text(encoding='utf-8')
+
+def _load_synthesizer_prompt() -> Tuple[str, str]:
+    """Load synthesizer prompt as (static_prefix, dynamic_suffix)."""
+    return load_prompt("slider_synthesizer.md")
+
+
+def _regime_bucket(market_summary: str) -> Tuple:
+    """
+    Coarse market regime: session phase, side of VWAP and RSI(14) band.
+
+    Fields missing from the summary bucket as None, so a partial summary
+    still keys consistently.
+    """
+    price = _PRICE_RE.search(market_summary)
+    vwap = _VWAP_RE.search(market_summary)
+    rsi = _RSI_RE.search(market_summary)
+
+    side = None
+    if price and vwap:
+        side = float(price.group(1)) >= float(vwap.group(1))
+    band = None
+    if rsi:
+        value = float(rsi.group(1))
+        band = "oversold" if value < 30 else "overbought" if value > 70 else "neutral"
+    return get_market_session()["session_name"], side, band
+
+
+def _synthesis_key(strategy_results: Dict[str, Dict], market_summary: str = "") -> Tuple:
+    """
+    Canonical cache key: the coarse regime bucket plus each strategy's
+    signal snapped to SYNTHESIS_CACHE_STEP.
+
+    Raw market data is left out on purpose; it changes every tick, while
+    the regime and the strategy signals derived from it usually don't.
+    The bucket keeps a synthesis from being replayed across a session
+    change or a cross of VWAP when the strategies happen to agree.
+    """
+    signals = tuple(sorted(
+        (
+            name,
+            bool(r.get("success")),
+            round(float(r.get("slider", 0)) / SYNTHESIS_CACHE_STEP),
+            round(float(r.get("confidence", 0)) / SYNTHESIS_CACHE_STEP),
+        )
+        for name, r in strategy_results.items()
+    ))
+    return _regime_bucket(market_summary), signals
+
+
+def _synthesis_cache_get(key: Tuple) -> Optional[Dict]:
+    """Return a copy of a cached synthesis if present and not expired."""
+    with _synthesis_cache_lock:
+        hit = _synthesis_cache.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] >= SYNTHESIS_CACHE_TTL_SECONDS:
+            del _synthesis_cache[key]
+            return None
+        _synthesis_cache.move_to_end(key)
+        return dict(hit[1])
+
+
+def _synthesis_cache_put(key: Tuple, result: Dict):
+    """Store a synthesis, evicting the least recently used entries."""
+    with _synthesis_cache_lock:
+        _synthesis_cache[key] = (time.monotonic(), dict(result))
+        _synthesis_cache.move_to_end(key)
+        while len(_synthesis_cache) > SYNTHESIS_CACHE_MAX_ENTRIES:
+            _synthesis_cache.popitem(last=False)
+
+
+def clear_synthesis_cache():
+    """Drop all cached syntheses (e.g. on a market session change)."""
+    with _synthesis_cache_lock:
+        _synthesis_cache.clear()
 
 
 def synthesize_final_slider(
@@ -48,10 +129,16 @@ def synthesize_final_slider(
     """
     # Try DeepSeek synthesis
     if deepseek.is_deepseek_configured():
+        key = _synthesis_key(strategy_results, market_summary)
+        cached = _synthesis_cache_get(key)
+        if cached is not None:
+            logger.info(f"DeepSeek synthesis (cached): slider={cached['final_slider']:.2f}")
+            return cached
         try:
             result = _deepseek_synthesize(strategy_results, market_summary)
             if result.get("success"):
                 logger.info(f"DeepSeek synthesis: slider={result['final_slider']:.2f}")
+                _synthesis_cache_put(key, result)
                 return result
         except Exception as e:
             logger.warning(f"DeepSeek synthesis failed: {e}")
@@ -68,24 +155,26 @@ def _deepseek_synthesize(
     market_summary: str
 ) -> Dict:
     """Run DeepSeek-based synthesis."""
-    prompt_template = _load_synthesizer_prompt()
-    if not prompt_template:
+    prefix, suffix = _load_synthesizer_prompt()
+    if not suffix:
         return {"success": False}
 
     # Format strategy outputs with compressed reasoning
-    from .strategy_nodes import format_strategy_outputs_for_synthesizer
     strategy_table = format_strategy_outputs_for_synthesizer(strategy_results)
 
-    # Build prompt
-    prompt = prompt_template.replace("{strategy_outputs}", strategy_table)
-    prompt = prompt.replace("{market_summary}", market_summary or "No additional market context")
+    # Only the suffix has placeholders; the prefix goes out verbatim as the
+    # system message so DeepSeek's prefix cache can reuse it every cycle
+    prompt = render_prompt(compile_prompt(suffix), {
+        "strategy_outputs": strategy_table,
+        "market_summary": market_summary or "No additional market context",
+    })
 
-    logger.info(f"[synthesizer] Sending to DeepSeek ({len(prompt)} chars)")
-    logger.debug(f"[synthesizer] Full prompt:\n{prompt}")
+    logger.info(f"[synthesizer] Sending to DeepSeek ({len(prefix) + len(prompt)} chars)")
+    logger.debug(f"[synthesizer] Full prompt:\n{prefix}{prompt}")
 
     try:
         # Use max tokens for reasoner model (includes CoT + final answer)
-        raw = deepseek.make_deepseek_request(prompt)
+        raw = deepseek.make_deepseek_request(prompt, system=prefix)
         logger.info(f"[synthesizer] DeepSeek response ({len(raw)} chars): {raw[:300]}...")
         return _parse_synthesizer_output(raw)
     except Exception as e:
@@ -96,14 +185,7 @@ def _deepseek_synthesize(
 def _parse_synthesizer_output(raw: str) -> Dict:
     """Parse synthesizer LLM output."""
     try:
-        cleaned = raw.strip()
-        if cleaned.startswith("```"):
-            cleaned = cleaned.split("```")[1]
-            if cleaned.startswith("json"):
-                cleaned = cleaned[4:]
-        cleaned = cleaned.strip()
-
-        result = json.loads(cleaned)
+        result = fast_json.loads(strip_fences(raw))
 
         final_slider = float(result.get("final_slider", 0))
         final_slider = max(-1.0, min(1.0, final_slider))
@@ -119,7 +201,7 @@ def _parse_synthesizer_output(raw: str) -> Dict:
             "reasoning": result.get("reasoning", ""),
             "success": True,
         }
-    except (json.JSONDecodeError, ValueError) as e:
+    except fast_json.JSONDecodeError as e:
         logger.warning(f"Failed to parse synthesizer output: {e}")
         return {"success": False}
 
@@ -130,16 +212,17 @@ def _simple_weighted_average(strategy_results: Dict[str, Dict]) -> Dict:
 
     No agreement bonuses, no phase adjustments — just raw average.
     """
-    # Simple equal weights for active strategies
-    total_slider = 0.0
-    total_conf = 0.0
-    active_count = 0
-
-    for result in strategy_results.values():
-        if result.get("success") and result.get("confidence", 0) > 0.1:
-            total_slider += result.get("slider", 0) * result.get("confidence", 0)
-            total_conf += result.get("confidence", 0)
-            active_count += 1
+    # Confidence-weighted average over strategies that produced a signal
+    results = list(strategy_results.values())
+    n = len(results)
+    sliders = np.fromiter((r.get("slider", 0) for r in results), dtype=np.float64, count=n)
+    confs = np.fromiter((r.get("confidence", 0) for r in results), dtype=np.float64, count=n)
+    ok = np.fromiter((bool(r.get("success")) for r in results), dtype=bool, count=n)
+    active = ok & (confs > 0.1)
+
+    total_slider = float((sliders * confs)[active].sum())
+    total_conf = float(confs[active].sum())
+    active_count = int(active.sum())
 
     if total_conf > 0:
         final_slider = total_slider / total_conf
@@ -0,0 +1,82 @@
+"""
+Fast JSON - orjson-backed serialization with a stdlib fallback.
+
+orjson is a C extension that encodes/decodes several times faster than the
+stdlib json module. It is optional: if it isn't installed, the stdlib is used
+and output stays equivalent.
+"""
+
+import json
+from typing import Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# json.JSONDecodeError and orjson.JSONDecodeError both subclass ValueError
+JSONDecodeError = ValueError
+
+
+def dumps(obj, indent: bool = False, default: Optional[Callable] = None) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with 2-space indentation
+        default: Called for objects that can't otherwise be serialized
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        # Non-str dict keys are coerced to strings, as the stdlib does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, default=default
+    ).encode('utf-8')
+
+
+def loads(data):
+    """Deserialize JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class ObjectScanner:
+    """
+    Find where the first top-level JSON object ends in streamed text.
+
+    Feed chunks in order. feed() returns the offset just past the closing
+    brace within that chunk once the object is complete, else None. Text
+    before the first '{' (such as a ```json fence) is skipped, and braces
+    inside strings are ignored.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, chunk: str) -> Optional[int]:
+        for i, ch in enumerate(chunk):
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == '\\':
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '{':
+                self.depth += 1
+            elif self.depth:
+                if ch == '"':
+                    self.in_string = True
+                elif ch == '}':
+                    self.depth -= 1
+                    if self.depth == 0:
+                        return i + 1
+        return None
@@ -1,22 +1,45 @@
 import logging
-from datetime import datetime
+import sys
+import time
 from config import LOG_LEVEL
 
+_LOG_LEVELS = {"DEBUG": 1, "INFO": 2, "WARNING": 3, "ERROR": 4}
+_LEVEL_COLORS = {
+    "DEBUG": "\033[94m",
+    "INFO": "\033[92m",
+    "WARNING": "\033[93m",
+    "ERROR": "\033[91m"
+}
+_TIMESTAMP_COLOR = "\033[96m"
+_RESET_COLOR = "\033[0m"
+
+# Resolved once; LOG_LEVEL comes from config and doesn't change at runtime
+_MIN_LEVEL = _LOG_LEVELS.get(LOG_LEVEL, 2)
+
+# Colour codes only when writing to a terminal, not to a redirected file
+_USE_COLOR = sys.stdout is not None and sys.stdout.isatty()
+
+# Everything around the timestamp, per level
+if _USE_COLOR:
+    _LINE_PARTS = {
+        lvl: (_TIMESTAMP_COLOR + "[", f"] {color}[{lvl}]{_RESET_COLOR}{' ' * (8 - len(lvl))}")
+        for lvl, color in _LEVEL_COLORS.items()
+    }
+else:
+    _LINE_PARTS = {lvl: ("[", f"] [{lvl}]{' ' * (8 - len(lvl))}") for lvl in _LEVEL_COLORS}
+
+
 # Print log message
 def log(level, msg):
-    log_levels = {"DEBUG": 1, "INFO": 2, "WARNING": 3, "ERROR": 4}
-    level_color_codes = {
-        "DEBUG": "\033[94m",
-        "INFO": "\033[92m",
-        "WARNING": "\033[93m",
-        "ERROR": "\033[91m"
-    }
-    timestamp_color_code = "\033[96m"
-    reset_color_code = "\033[0m"
-    if log_levels.get(level, 2) >= log_levels.get(LOG_LEVEL, 2):
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        level_space = " " * (8 - len(level))
-        print(f"{timestamp_color_code}[{timestamp}] {level_color_codes[level]}[{level}]{reset_color_code}{level_space}{msg}")
+    if _LOG_LEVELS.get(level, 2) >= _MIN_LEVEL:
+        _write(level, msg)
+
+
+# Print a log line without the level check
+def _write(level, msg):
+    head, tail = _LINE_PARTS[level]
+    # One write per line so lines from different threads don't interleave
+    sys.stdout.write(f"{head}{time.strftime('%Y-%m-%d %H:%M:%S')}{tail}{msg}\n")
 
 
 # Print debug log message
@@ -48,13 +71,18 @@ def error(msg):
 # is silently discarded. This handler bridges the two systems.
 
 class _BridgeHandler(logging.Handler):
-    """Routes standard logging records through the custom log() function."""
+    """Routes standard logging records through the custom log() function.
+
+    The handler level mirrors LOG_LEVEL, so logging drops filtered records
+    before emit() and before their message is formatted; emit() doesn't
+    need to check again.
+    """
     def emit(self, record):
         level = record.levelname
         # Map standard logging levels to our custom levels
-        if level == "CRITICAL":
-            level = "ERROR"
-        log(level, record.getMessage())
+        if level not in _LINE_PARTS:
+            level = "ERROR" if record.levelno >= logging.ERROR else "INFO"
+        _write(level, record.getMessage())
 
 
 # Map our LOG_LEVEL string to a standard logging level
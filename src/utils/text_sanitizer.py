@@ -195,6 +195,35 @@ _EMOJI_PATTERN = re.compile(
 )
 
 
+# Runs of spaces left behind where emojis were removed
+_MULTI_SPACE = re.compile(r'  +')
+
+# Nothing below U+200D (zero width joiner) is an emoji or a replacement key,
+# so only runs of higher codepoints need work; ASCII, Latin-1 accents and
+# most non-Latin scripts are skipped at C speed
+_CANDIDATE_RUN = re.compile(r'[^\x00-\u200c]+')
+
+# Single-codepoint emojis go through str.translate; the few multi-codepoint
+# ones (variation-selector compounds) are matched first so they win over
+# their base character
+_SINGLE_REPLACEMENTS = {ord(k): v for k, v in EMOJI_REPLACEMENTS.items() if len(k) == 1}
+_MULTI_PATTERN = re.compile(
+    "|".join(re.escape(k) for k in sorted(
+        (k for k in EMOJI_REPLACEMENTS if len(k) > 1), key=len, reverse=True
+    ))
+)
+
+
+def _replace_known(match: re.Match) -> str:
+    return EMOJI_REPLACEMENTS[match.group(0)]
+
+
+def _clean_run(match: re.Match) -> str:
+    """Replace known emojis in a candidate run, then drop any that remain."""
+    run = _MULTI_PATTERN.sub(_replace_known, match.group(0)).translate(_SINGLE_REPLACEMENTS)
+    return _EMOJI_PATTERN.sub('', run)
+
+
 def strip_emojis(text: str) -> str:
     """
     Remove all emojis from text, replacing known ones with ASCII equivalents.
@@ -209,18 +238,16 @@ def strip_emojis(text: str) -> str:
     Returns:
         Text with emojis removed or replaced with ASCII equivalents
     """
-    if not text:
+    if not text or text.isascii():
         return text
 
-    # First, replace known emojis with ASCII equivalents
-    for emoji, replacement in EMOJI_REPLACEMENTS.items():
-        text = text.replace(emoji, replacement)
-
-    # Then remove any remaining emojis using the comprehensive regex
-    text = _EMOJI_PATTERN.sub('', text)
+    # Replace known emojis with ASCII equivalents, then remove any remaining
+    # emojis; both happen in one pass that skips over ordinary text
+    text = _CANDIDATE_RUN.sub(_clean_run, text)
 
     # Clean up any double spaces that may have resulted from removal
-    text = re.sub(r'  +', ' ', text)
+    if '  ' in text:
+        text = _MULTI_SPACE.sub(' ', text)
 
     return text
 
@@ -267,6 +294,6 @@ def is_safe_for_locale(text: str) -> bool:
     Returns:
         True if text contains no emojis, False otherwise
     """
-    if not text:
+    if not text or text.isascii():
         return True
     return _EMOJI_PATTERN.search(text) is None
@@ -2,15 +2,17 @@
 Event Bus - Simple pub/sub for trading events.
 
 Allows the trading bot to publish events that the web UI can subscribe to.
-Uses a thread-safe queue for events.
+Events live in a bounded, thread-safe history shared by all subscribers.
 """
 
-import json
+import itertools
 import logging
-import queue
 import threading
+from collections import deque
 from datetime import datetime
-from typing import Dict, Generator, Optional, Any
+from typing import Dict, Generator, Optional, Any, Tuple
+
+from src.utils import fast_json
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +20,15 @@ logger = logging.getLogger(__name__)
 _event_bus: Optional['EventBus'] = None
 _event_bus_lock = threading.Lock()
 
+# After a stream wakes up it lingers this long for more events (or until
+# this many are pending), so a burst goes out as one write, not one per event
+STREAM_BATCH_WINDOW = 0.1
+STREAM_BATCH_MAX_EVENTS = 16
+
+# An SSE frame is _SSE_PREFIX + the event's JSON + _SSE_SUFFIX
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
 
 class EventBus:
     """
@@ -25,6 +36,12 @@ class EventBus:
     
     Events are published by the trading bot and consumed by SSE clients.
     Thread-safe for use across bot and web server threads.
+    
+    Subscribers share the history ring rather than each owning a queue:
+    every event gets a sequence number, a stream remembers the last number
+    it sent, and publishing is one append plus a notify_all(). Each entry
+    is stored with its encoded SSE frame (bytes), so an event is serialized once no
+    matter how many clients are connected.
     """
     
     def __init__(self, max_events: int = 100):
@@ -34,10 +51,9 @@ class EventBus:
         Args:
             max_events: Maximum events to keep in history
         """
-        self._subscribers: Dict[int, queue.Queue] = {}
-        self._subscriber_lock = threading.Lock()
-        self._next_id = 0
-        self._event_history: list = []
+        self._cond = threading.Condition()
+        self._event_history: deque = deque(maxlen=max_events)
+        self._published = 0  # Sequence number of the next event
         self._max_events = max_events
         self._latest_status: Dict[str, Any] = {
             'mode': 'unknown',
@@ -46,95 +62,111 @@ class EventBus:
             'buffered_decisions': 0,
         }
     
-    def publish(self, event_type: str, data: Dict):
+    def publish(self, event_type: str, data: Dict) -> str:
         """
         Publish an event to all subscribers.
         
         Args:
             event_type: Type of event (e.g., 'trade', 'cycle_complete', 'eod_review')
             data: Event data dict
+            
+        Returns:
+            The event's ISO timestamp, for callers that record it elsewhere
         """
+        timestamp = datetime.now().isoformat(timespec='seconds')
         event = {
             'type': event_type,
             'data': data,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
         }
         
-        # Add to history
-        self._event_history.append(event)
-        if len(self._event_history) > self._max_events:
-            self._event_history = self._event_history[-self._max_events:]
+        # Serialized to the final SSE bytes here, on the publisher's thread;
+        # default=str keeps an odd value (e.g. a datetime) from raising into
+        # the trading bot
+        payload = _SSE_PREFIX + fast_json.dumps(event, default=str) + _SSE_SUFFIX
         
-        # Send to all subscribers
-        with self._subscriber_lock:
-            dead_subscribers = []
-            for sub_id, sub_queue in self._subscribers.items():
-                try:
-                    sub_queue.put_nowait(event)
-                except queue.Full:
-                    dead_subscribers.append(sub_id)
-            
-            # Remove dead subscribers
-            for sub_id in dead_subscribers:
-                del self._subscribers[sub_id]
+        with self._cond:
+            self._event_history.append((event, payload))
+            self._published += 1
+            self._cond.notify_all()
         
         logger.debug(f"Published event: {event_type}")
+        return timestamp
     
-    def subscribe(self) -> tuple:
-        """
-        Subscribe to events.
-        
-        Returns:
-            Tuple of (subscriber_id, queue)
-        """
-        with self._subscriber_lock:
-            sub_id = self._next_id
-            self._next_id += 1
-            sub_queue = queue.Queue(maxsize=50)
-            self._subscribers[sub_id] = sub_queue
-            logger.debug(f"New subscriber: {sub_id}")
-            return sub_id, sub_queue
-    
-    def unsubscribe(self, subscriber_id: int):
+    def _events_since(self, seq: int) -> Tuple[list, int]:
         """
-        Unsubscribe from events.
+        Encoded SSE frames of events published at or after sequence number seq,
+        oldest first.
         
-        Args:
-            subscriber_id: ID returned from subscribe()
+        Events that have already dropped out of the history are skipped.
+        Caller holds the condition. Returns (payloads, next_seq).
         """
-        with self._subscriber_lock:
-            if subscriber_id in self._subscribers:
-                del self._subscribers[subscriber_id]
-                logger.debug(f"Removed subscriber: {subscriber_id}")
+        missed = self._published - seq
+        if missed <= 0:
+            return [], self._published
+        skip = max(0, len(self._event_history) - missed)
+        entries = itertools.islice(self._event_history, skip, None)
+        return [payload for _, payload in entries], self._published
     
-    def get_event_stream(self, timeout: float = 30.0) -> Generator[str, None, None]:
+    def get_event_stream(self, timeout: float = 30.0) -> Generator[bytes, None, None]:
         """
         Get SSE event stream.
         
         Yields:
-            SSE-formatted event strings
+            UTF-8 encoded SSE frames, ready to write to the socket
         """
-        sub_id, sub_queue = self.subscribe()
+        # First, send any recent events (as one chunk, so one socket write)
+        with self._cond:
+            payloads, seq = self._events_since(self._published - 10)
+        if payloads:
+            yield b"".join(payloads)
         
-        try:
-            # First, send any recent events
-            for event in self._event_history[-10:]:
-                yield f"data: {json.dumps(event)}\n\n"
+        # Then stream new events
+        while True:
+            with self._cond:
+                if not self._cond.wait_for(lambda: self._published > seq, timeout=timeout):
+                    payloads = None
+                else:
+                    self._cond.wait_for(
+                        lambda: self._published - seq >= STREAM_BATCH_MAX_EVENTS,
+                        timeout=STREAM_BATCH_WINDOW,
+                    )
+                    payloads, seq = self._events_since(seq)
             
-            # Then stream new events
-            while True:
-                try:
-                    event = sub_queue.get(timeout=timeout)
-                    yield f"data: {json.dumps(event)}\n\n"
-                except queue.Empty:
-                    # Send keepalive
-                    yield f": keepalive\n\n"
-        finally:
-            self.unsubscribe(sub_id)
+            if payloads is None:
+                # Send keepalive
+                yield b": keepalive\n\n"
+                continue
+            yield b"".join(payloads)
+    
+    @property
+    def published(self) -> int:
+        """Number of events published so far (a sequence number that only grows)."""
+        return self._published
+    
+    @property
+    def max_events(self) -> int:
+        """Number of events kept in history."""
+        return self._max_events
     
     def get_history(self, count: int = 20) -> list:
         """Get recent event history."""
-        return self._event_history[-count:]
+        with self._cond:
+            skip = max(0, len(self._event_history) - count) if count > 0 else 0
+            return [event for event, _ in itertools.islice(self._event_history, skip, None)]
+    
+    def get_history_json(self, count: int = 20) -> bytes:
+        """
+        Recent event history as an encoded JSON array.
+        
+        Spliced together from the stored SSE frames, so nothing is
+        re-serialized.
+        """
+        start, end = len(_SSE_PREFIX), -len(_SSE_SUFFIX)
+        with self._cond:
+            skip = max(0, len(self._event_history) - count) if count > 0 else 0
+            frames = [frame for _, frame in itertools.islice(self._event_history, skip, None)]
+        return b"[" + b",".join(frame[start:end] for frame in frames) + b"]"
     
     def update_status(self, **kwargs):
         """Update latest status."""
@@ -149,6 +181,11 @@ def get_event_bus() -> EventBus:
     """Get or create the global event bus instance."""
     global _event_bus
     
+    # Once created the bus never changes, so only creation needs the lock
+    bus = _event_bus
+    if bus is not None:
+        return bus
+    
     with _event_bus_lock:
         if _event_bus is None:
             _event_bus = EventBus()
@@ -168,13 +205,14 @@ def publish_trade(symbol: str, action: str, quantity: float, result: str, detail
 
 def publish_cycle_complete(decisions: int, sold: list, bought: list, errors: list):
     """Convenience function to publish cycle completion."""
-    get_event_bus().publish('cycle_complete', {
+    bus = get_event_bus()
+    timestamp = bus.publish('cycle_complete', {
         'decisions': decisions,
         'sold': sold,
         'bought': bought,
         'errors': errors,
     })
-    get_event_bus().update_status(last_cycle=datetime.now().isoformat())
+    bus.update_status(last_cycle=timestamp)
 
 
 def publish_eod_review(results: Dict):
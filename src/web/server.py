@@ -7,22 +7,41 @@ Provides:
 - SSE endpoint for live updates
 """
 
-import json
+import functools
+import hashlib
 import logging
+import os
+import re
 import threading
 import time
+import traceback
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
-from flask import Flask, Response, jsonify, render_template, request
+from flask import Blueprint, Flask, Response, current_app, render_template, request
 
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
+from src.utils import fast_json
 from .event_bus import get_event_bus
 
 logger = logging.getLogger(__name__)
 
 SLIDER_STATUS_FILE = Path("kb/slider_status.json")
 
+# KB markdown sections: body runs until the next heading of any level
+_LESSON_SECTION_RE = re.compile(
+    r"^### (What Works|What Doesn't Work)[^\n]*\n(.*?)(?=^#|\Z)", re.M | re.S
+)
+_RECENT_LESSONS_RE = re.compile(r"^## Recent Lessons[^\n]*\n(.*?)(?=^#|\Z)", re.M | re.S)
+_BULLET_RE = re.compile(r"^[ \t]*- (.+?)[ \t\r]*$", re.M)
+
 # Shared state for trading bot integration
 _trading_state: Dict = {
     'mode': 'unknown',
@@ -35,6 +54,100 @@ _trading_state: Dict = {
 }
 _state_lock = threading.Lock()
 
+# Immutable copy of _trading_state, replaced wholesale on every write so
+# readers can take it without the lock (rebinding a global is atomic)
+_state_snapshot: Dict = dict(_trading_state)
+
+# Manual EOD reviews run one at a time off the request thread
+EOD_JOBS_KEPT = 8
+_eod_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eod-review")
+_eod_jobs: Dict[str, Future] = {}
+_eod_jobs_lock = threading.Lock()
+
+# Each open SSE stream holds a server thread for as long as the client stays
+# connected, so they are capped well below the worker pool size. A client
+# over the cap is told to reconnect after SSE_RETRY_MS instead.
+MAX_SSE_STREAMS = 8
+SSE_RETRY_MS = 15000
+# Must stay below the server's channel_timeout so idle streams aren't dropped
+SSE_KEEPALIVE_SECONDS = 30
+_sse_slots = threading.BoundedSemaphore(MAX_SSE_STREAMS)
+
+
+def _get(key: str):
+    """Read one trading-state entry from the snapshot (None if unset)."""
+    return _state_snapshot.get(key)
+
+
+def _json(obj, status: int = 200) -> Response:
+    """JSON response encoded via fast_json (orjson when available)."""
+    return Response(fast_json.dumps(obj, default=str), status=status, mimetype='application/json')
+
+
+def _int_arg(name: str, default: int, lo: int, hi: int) -> int:
+    """Integer query parameter clamped to [lo, hi] (default if missing or malformed)."""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        n = int(value)
+    except ValueError:
+        return default
+    return lo if n < lo else hi if n > hi else n
+
+
+# Distinguishes this process' event sequence numbers from a previous run's
+_ETAG_SALT = uuid.uuid4().hex
+
+
+def _etag(*parts) -> str:
+    """Short opaque ETag for a response determined by parts."""
+    return hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _with_etag(response: Response, etag: str) -> Response:
+    """Tag a response so the browser revalidates it on every poll."""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def _not_modified(etag: str) -> Response:
+    """Empty 304 for a client whose cached copy is still current."""
+    return _with_etag(Response(status=304), etag)
+
+
+# Short-lived cache of encoded JSON bodies for dashboard polling endpoints
+RESPONSE_CACHE_TTL_SECONDS = 0.5
+_RESPONSE_CACHE_MAX_ENTRIES = 64
+
+
+def _ttl_json(view):
+    """
+    Serve a view's dict as JSON, reusing the encoded body for
+    RESPONSE_CACHE_TTL_SECONDS per URL.
+    
+    Several dashboard tabs polling the same endpoint then share one
+    build + encode per window.
+    """
+    cache: Dict[str, Tuple[float, bytes]] = {}
+    
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.full_path
+        now = time.monotonic()
+        hit = cache.get(key)
+        if hit is not None and hit[0] > now:
+            body = hit[1]
+        else:
+            body = fast_json.dumps(view(*args, **kwargs), default=str)
+            if len(cache) >= _RESPONSE_CACHE_MAX_ENTRIES:
+                cache.clear()
+            cache[key] = (now + RESPONSE_CACHE_TTL_SECONDS, body)
+        return Response(body, mimetype='application/json')
+    
+    return wrapper
+
 
 def create_app(static_folder: str = None, template_folder: str = None) -> Flask:
     """
@@ -60,261 +173,354 @@ def create_app(static_folder: str = None, template_folder: str = None) -> Flask:
         template_folder=template_folder,
     )
     
-    # Register routes
-    register_routes(app)
+    app.register_blueprint(bp)
     
     return app
 
 
-def register_routes(app: Flask):
-    """Register all routes on the Flask app."""
-    
-    @app.route('/')
-    def dashboard():
-        """Serve the main dashboard page."""
-        state = get_trading_state()
-        return render_template('dashboard.html', ui_mode=state.get('mode', 'unknown'))
+# Dashboard page and API endpoints, registered on each app by create_app()
+bp = Blueprint('dashboard', __name__)
+
+
+@bp.route('/')
+def dashboard():
+    """Serve the main dashboard page."""
+    ui_mode = _get('mode') or 'unknown'
+    # The page only varies with the trading mode, so it is rendered once per
+    # mode (every time in debug mode, so template edits show up)
+    rendered = current_app.extensions.setdefault('rendered_dashboards', {})
+    body = rendered.get(ui_mode)
+    if body is None:
+        body = render_template('dashboard.html', ui_mode=ui_mode).encode('utf-8')
+        if not current_app.debug:
+            rendered[ui_mode] = body
+    return Response(body, mimetype='text/html')
+
+
+@bp.route('/api/status')
+@_ttl_json
+def api_status():
+    """Get current trading status."""
+    state = _state_snapshot
+    status = {
+        'mode': state.get('mode', 'unknown'),
+        'running': state.get('running', False),
+        'last_cycle_time': state.get('last_cycle_time'),
+        'buffered_decisions': 0,
+    }
+
+    # Get buffered decision count
+    buffer = state.get('decision_buffer')
+    if buffer:
+        status['buffered_decisions'] = buffer.get_decision_count()
+
+    # Merge with event bus status
+    event_status = get_event_bus().get_status()
+    status.update(event_status)
+
+    return status
+
+
+@bp.route('/api/decisions')
+def api_decisions():
+    """Get buffered decisions awaiting EOD review."""
+    buffer = _get('decision_buffer')
+    if not buffer:
+        return _json({'decisions': [], 'count': 0})
+
+    decisions = buffer.peek_decisions(50)  # Limit to 50
+    tail = fast_json.dumps({
+        'count': buffer.get_decision_count(),
+        'date': buffer.current_date,
+        'start_value': buffer.start_of_day_value,
+    }, default=str)
     
-    @app.route('/api/status')
-    def api_status():
-        """Get current trading status."""
-        with _state_lock:
-            status = {
-                'mode': _trading_state.get('mode', 'unknown'),
-                'running': _trading_state.get('running', False),
-                'last_cycle_time': _trading_state.get('last_cycle_time'),
-                'buffered_decisions': 0,
-            }
-            
-            # Get buffered decision count
-            buffer = _trading_state.get('decision_buffer')
-            if buffer:
-                status['buffered_decisions'] = buffer.get_decision_count()
-        
-        # Merge with event bus status
-        event_status = get_event_bus().get_status()
-        status.update(event_status)
-        
-        return jsonify(status)
+    def generate():
+        # Decisions can carry long reasoning text, so encode and send them
+        # one at a time rather than building the whole body first
+        yield b'{"decisions":['
+        for i, decision in enumerate(decisions):
+            if i:
+                yield b','
+            yield fast_json.dumps(decision, default=str)
+        yield b'],' + tail[1:]
     
-    @app.route('/api/decisions')
-    def api_decisions():
-        """Get buffered decisions awaiting EOD review."""
-        with _state_lock:
-            buffer = _trading_state.get('decision_buffer')
-            if not buffer:
-                return jsonify({'decisions': [], 'count': 0})
-            
-            data = buffer.get_decisions_for_eod()
-            return jsonify({
-                'decisions': data.get('decisions', [])[:50],  # Limit to 50
-                'count': len(data.get('decisions', [])),
-                'date': data.get('date'),
-                'start_value': data.get('start_of_day_value'),
+    return Response(generate(), mimetype='application/json')
+
+
+@bp.route('/api/lessons')
+def api_lessons():
+    """Get lessons learned from KB (304 if the KB files haven't changed)."""
+    kb_reader = _get('kb_reader')
+    if not kb_reader:
+        return _json({
+            'what_works': [],
+            'what_doesnt': [],
+            'total': 0,
+        })
+
+    kb_root = Path(kb_reader.kb_root)
+    lessons_stat = _stat_key(kb_root / "lessons_learned.md")
+    master_stat = _stat_key(kb_root / "master_index.md")
+    etag = _etag(kb_root, lessons_stat, master_stat)
+    if etag in request.if_none_match:
+        return _not_modified(etag)
+
+    response = _json(_load_lessons(kb_root, lessons_stat, master_stat))
+    return _with_etag(response, etag)
+
+
+@bp.route('/api/history')
+def api_history():
+    """Get recent trading event history."""
+    bus = get_event_bus()
+    count = _int_arg('count', 20, 1, bus.max_events)
+    # Read before the history: the tag may then be older than the body it
+    # labels (costing one extra full response), never newer
+    etag = _etag(_ETAG_SALT, bus.published, count)
+    if etag in request.if_none_match:
+        return _not_modified(etag)
+
+    body = b'{"events":' + bus.get_history_json(count) + b'}'
+    return _with_etag(Response(body, mimetype='application/json'), etag)
+
+
+@bp.route('/api/eod-review', methods=['POST'])
+def api_trigger_eod():
+    """
+    Trigger EOD review manually.
+
+    The review runs on a background worker; this returns 202 with a
+    job id to poll at /api/eod-review/<job_id>. If a review is already
+    queued or running, its job id is returned instead of starting another.
+    """
+    reviewer = _get('eod_reviewer')
+    if not reviewer:
+        return _json({
+            'success': False,
+            'error': 'EOD reviewer not initialized',
+        }, 500)
+
+    with _eod_jobs_lock:
+        for job_id, future in _eod_jobs.items():
+            if not future.done():
+                return _json({'success': True, 'job_id': job_id, 'status': 'running'}, 202)
+
+        logger.info("Manual EOD review triggered from UI")
+        job_id = uuid.uuid4().hex
+        _eod_jobs[job_id] = _eod_executor.submit(_run_eod_review, reviewer)
+        while len(_eod_jobs) > EOD_JOBS_KEPT:
+            del _eod_jobs[next(iter(_eod_jobs))]
+
+    return _json({'success': True, 'job_id': job_id, 'status': 'queued'}, 202)
+
+
+@bp.route('/api/eod-review/<job_id>')
+def api_eod_job(job_id: str):
+    """Get the status (and, once finished, the results) of an EOD review job."""
+    with _eod_jobs_lock:
+        future = _eod_jobs.get(job_id)
+    if future is None:
+        return _json({'success': False, 'error': 'Unknown EOD review job'}, 404)
+
+    if not future.done():
+        return _json({'success': True, 'done': False})
+
+    e = future.exception()
+    if e is not None:
+        return _json({
+            'success': False,
+            'done': True,
+            'error': str(e),
+            'traceback': ''.join(traceback.format_exception(type(e), e, e.__traceback__)),
+        }, 500)
+
+    return _json({
+        'success': True,
+        'done': True,
+        'results': future.result(),
+    })
+
+
+@bp.route('/api/slider/status')
+def api_slider_status():
+    """Get current slider bot status."""
+    try:
+        if SLIDER_STATUS_FILE.exists():
+            # Written atomically as JSON by the bot; pass the bytes through
+            return Response(SLIDER_STATUS_FILE.read_bytes(), mimetype='application/json')
+        return _json({'error': 'No status file found'}, 404)
+    except Exception as e:
+        logger.error(f"Error reading slider status: {e}")
+        return _json({'error': str(e)}, 500)
+
+
+@bp.route('/api/slider/reset', methods=['POST'])
+def api_slider_reset():
+    """Reset slider bot - benchmarks, position, and PnL back to initial state."""
+    try:
+        # Get optional new capital from request
+        data = request.get_json() or {}
+        new_capital = data.get('capital', 10000.0)
+
+        slider_bot = _get('slider_bot')
+
+        if slider_bot:
+            # Reset via bot instance
+            slider_bot.reset(new_capital)
+            logger.info(f"Slider bot reset via API. New capital: ${new_capital:,.2f}")
+            return _json({
+                'success': True,
+                'message': f'Reset complete. Starting capital: ${new_capital:,.2f}',
+                'capital': new_capital,
             })
-    
-    @app.route('/api/lessons')
-    def api_lessons():
-        """Get lessons learned from KB."""
-        with _state_lock:
-            kb_reader = _trading_state.get('kb_reader')
-            if not kb_reader:
-                return jsonify({
-                    'what_works': [],
-                    'what_doesnt': [],
-                    'total': 0,
-                })
-        
-        lessons = _load_lessons(kb_reader)
-        return jsonify(lessons)
-    
-    @app.route('/api/history')
-    def api_history():
-        """Get recent trading event history."""
-        count = request.args.get('count', 20, type=int)
-        events = get_event_bus().get_history(count)
-        return jsonify({'events': events})
-    
-    @app.route('/api/eod-review', methods=['POST'])
-    def api_trigger_eod():
-        """Trigger EOD review manually."""
-        with _state_lock:
-            reviewer = _trading_state.get('eod_reviewer')
-            if not reviewer:
-                return jsonify({
-                    'success': False,
-                    'error': 'EOD reviewer not initialized',
-                }), 500
-        
-        try:
-            logger.info("Manual EOD review triggered from UI")
-            results = reviewer.run()
-            
-            # Publish to event bus
-            get_event_bus().publish('eod_review', results)
-            
-            return jsonify({
+        else:
+            # No bot instance, just delete state files
+            from src.slider.benchmark import DEFAULT_STATE_FILE
+            from src.slider.slider_bot import HISTORY_PATH, LEGACY_HISTORY_PATH
+
+            deleted = []
+            for f in [Path(DEFAULT_STATE_FILE), HISTORY_PATH, LEGACY_HISTORY_PATH, SLIDER_STATUS_FILE]:
+                if f.exists():
+                    f.unlink()
+                    deleted.append(str(f))
+
+            logger.info(f"Slider reset (no bot): deleted {deleted}")
+            return _json({
                 'success': True,
-                'results': results,
+                'message': 'State files deleted. Bot will reinitialize on next cycle.',
+                'deleted_files': deleted,
             })
-        except Exception as e:
-            import traceback
-            tb = traceback.format_exc()
-            logger.error(f"EOD review failed: {e}\n{tb}")
-            return jsonify({
-                'success': False,
-                'error': str(e),
-                'traceback': tb,
-            }), 500
-            return jsonify({
-                'success': False,
-                'error': str(e),
-                'traceback': tb,
-            }), 500
-    
-    @app.route('/api/slider/status')
-    def api_slider_status():
-        """Get current slider bot status."""
-        try:
-            if SLIDER_STATUS_FILE.exists():
-                data = json.loads(SLIDER_STATUS_FILE.read_text())
-                return jsonify(data)
-            return jsonify({'error': 'No status file found'}), 404
-        except Exception as e:
-            logger.error(f"Error reading slider status: {e}")
-            return jsonify({'error': str(e)}), 500
-
-    @app.route('/api/slider/reset', methods=['POST'])
-    def api_slider_reset():
-        """Reset slider bot - benchmarks, position, and PnL back to initial state."""
+
+    except Exception as e:
+        logger.error(f"Slider reset failed: {e}")
+        return _json({'success': False, 'error': str(e)}, 500)
+
+
+@bp.route('/api/stream')
+def api_stream():
+    """SSE endpoint for live updates (at most MAX_SSE_STREAMS at once)."""
+    def generate():
+        # The slot is taken inside the generator so the finally below always
+        # releases it: the server closes the iterator when the client goes away
+        if not _sse_slots.acquire(blocking=False):
+            logger.warning("SSE stream limit reached, asking client to retry")
+            yield f"retry: {SSE_RETRY_MS}\n\n".encode('ascii')
+            return
+        stream = get_event_bus().get_event_stream(timeout=SSE_KEEPALIVE_SECONDS)
         try:
-            # Get optional new capital from request
-            data = request.get_json() or {}
-            new_capital = data.get('capital', 10000.0)
-
-            with _state_lock:
-                slider_bot = _trading_state.get('slider_bot')
-
-            if slider_bot:
-                # Reset via bot instance
-                slider_bot.reset(new_capital)
-                logger.info(f"Slider bot reset via API. New capital: ${new_capital:,.2f}")
-                return jsonify({
-                    'success': True,
-                    'message': f'Reset complete. Starting capital: ${new_capital:,.2f}',
-                    'capital': new_capital,
-                })
-            else:
-                # No bot instance, just delete state files
-                from pathlib import Path
-                state_file = Path("benchmark_state.json")
-                history_file = Path("slider_history.json")
-
-                deleted = []
-                for f in [state_file, history_file, SLIDER_STATUS_FILE]:
-                    if f.exists():
-                        f.unlink()
-                        deleted.append(str(f))
-
-                logger.info(f"Slider reset (no bot): deleted {deleted}")
-                return jsonify({
-                    'success': True,
-                    'message': 'State files deleted. Bot will reinitialize on next cycle.',
-                    'deleted_files': deleted,
-                })
-
-        except Exception as e:
-            logger.error(f"Slider reset failed: {e}")
-            return jsonify({'success': False, 'error': str(e)}), 500
-
-    @app.route('/api/stream')
-    def api_stream():
-        """SSE endpoint for live updates."""
-        def generate():
-            for event in get_event_bus().get_event_stream():
-                yield event
-        
-        return Response(
-            generate(),
-            mimetype='text/event-stream',
-            headers={
-                'Cache-Control': 'no-cache',
-                'Connection': 'keep-alive',
-                'X-Accel-Buffering': 'no',
-            }
-        )
-
-
-def _load_lessons(kb_reader) -> Dict:
-    """Load lessons from KB files."""
-    what_works = []
-    what_doesnt = []
+            # Each chunk from the bus is already every pending frame joined
+            # into one bytes object, so the server makes one write per wakeup
+            yield from stream
+        finally:
+            stream.close()
+            _sse_slots.release()
     
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+        }
+    )
+
+
+def _run_eod_review(reviewer) -> Dict:
+    """Run an EOD review on the worker and publish its results."""
     try:
-        lessons_path = kb_reader.kb_root / "lessons_learned.md"
-        if lessons_path.exists():
-            content = lessons_path.read_text()
-            
-            # Parse "What Works" section
-            works_start = content.find("### What Works")
-            doesnt_start = content.find("### What Doesn't Work")
-            
-            if works_start >= 0 and doesnt_start >= 0:
-                works_section = content[works_start:doesnt_start]
-                for line in works_section.split('\n'):
-                    if line.strip().startswith('-'):
-                        what_works.append(line.strip()[2:])
-            
-            if doesnt_start >= 0:
-                doesnt_section = content[doesnt_start:]
-                next_section = doesnt_section.find('\n###', 10)
-                if next_section > 0:
-                    doesnt_section = doesnt_section[:next_section]
-                for line in doesnt_section.split('\n'):
-                    if line.strip().startswith('-'):
-                        what_doesnt.append(line.strip()[2:])
-        
-        # Also check master_index.md for recent lessons
-        master_path = kb_reader.kb_root / "master_index.md"
-        if master_path.exists() and (not what_works and not what_doesnt):
-            content = master_path.read_text()
-            lessons_start = content.find("## Recent Lessons")
-            if lessons_start >= 0:
-                lessons_end = content.find("##", lessons_start + 10)
-                if lessons_end < 0:
-                    lessons_end = len(content)
-                
-                lessons_section = content[lessons_start:lessons_end]
-                for line in lessons_section.split('\n'):
-                    if line.strip().startswith('-'):
-                        lesson = line.strip()[2:]
-                        if '[Q1]' in lesson or '[Q3]' in lesson:
-                            what_works.append(lesson)
-                        elif '[Q2]' in lesson or '[Q4]' in lesson:
-                            what_doesnt.append(lesson)
-                        else:
-                            what_works.append(lesson)  # Default to works
+        results = reviewer.run()
+    except Exception as e:
+        logger.error(f"EOD review failed: {e}\n{traceback.format_exc()}")
+        raise
     
+    # Publish to event bus
+    get_event_bus().publish('eod_review', results)
+    return results
+
+
+def _load_lessons(
+    kb_root: Path,
+    lessons_stat: Optional[Tuple[int, int]],
+    master_stat: Optional[Tuple[int, int]],
+) -> Dict:
+    """Load lessons from KB files, re-parsing only when a file changes."""
+    try:
+        lessons = _parse_lessons(str(kb_root), lessons_stat, master_stat)
     except Exception as e:
         logger.error(f"Error loading lessons: {e}")
+        lessons = ((), ())
     
+    what_works, what_doesnt = lessons
     return {
-        'what_works': what_works[:20],  # Limit to 20 each
-        'what_doesnt': what_doesnt[:20],
+        'what_works': list(what_works[:20]),  # Limit to 20 each
+        'what_doesnt': list(what_doesnt[:20]),
         'total': len(what_works) + len(what_doesnt),
     }
 
 
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_utf8(path: Path) -> str:
+    """Read a KB file as UTF-8 (how src.kb.writer writes it), whatever the locale."""
+    return path.read_bytes().decode('utf-8', 'replace')
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_lessons(
+    kb_root: str,
+    lessons_stat: Optional[Tuple[int, int]],
+    master_stat: Optional[Tuple[int, int]],
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Parse (what_works, what_doesnt) from the KB lesson files.
+    
+    The stat tuples only key the cache: a changed file gets a new entry and
+    stale ones age out.
+    """
+    what_works = []
+    what_doesnt = []
+    
+    if lessons_stat is not None:
+        content = _read_utf8(Path(kb_root) / "lessons_learned.md")
+        for section in _LESSON_SECTION_RE.finditer(content):
+            target = what_works if section.group(1) == "What Works" else what_doesnt
+            target.extend(_BULLET_RE.findall(section.group(2)))
+    
+    # Also check master_index.md for recent lessons
+    if master_stat is not None and (not what_works and not what_doesnt):
+        content = _read_utf8(Path(kb_root) / "master_index.md")
+        section = _RECENT_LESSONS_RE.search(content)
+        if section:
+            for lesson in _BULLET_RE.findall(section.group(1)):
+                if '[Q1]' in lesson or '[Q3]' in lesson:
+                    what_works.append(lesson)
+                elif '[Q2]' in lesson or '[Q4]' in lesson:
+                    what_doesnt.append(lesson)
+                else:
+                    what_works.append(lesson)  # Default to works
+    
+    return tuple(what_works), tuple(what_doesnt)
+
+
 def set_trading_state(**kwargs):
     """Set trading state from the main bot."""
+    global _state_snapshot
     with _state_lock:
         _trading_state.update(kwargs)
+        _state_snapshot = dict(_trading_state)
 
 
 def get_trading_state() -> Dict:
     """Get current trading state."""
-    with _state_lock:
-        return _trading_state.copy()
+    return dict(_state_snapshot)
 
 
 def run_server(
@@ -338,7 +544,27 @@ def run_server(
     # Start slider file watcher
     _start_slider_watcher()
     
-    app.run(host=host, port=port, debug=debug, threaded=threaded)
+    if debug or waitress_serve is None:
+        app.run(host=host, port=port, debug=debug, threaded=threaded)
+    else:
+        _serve_waitress(app, host, port)
+
+
+# One thread per possible SSE stream, plus headroom for ordinary requests
+WSGI_THREADS = MAX_SSE_STREAMS + max(8, (os.cpu_count() or 1) * 2)
+
+
+def _serve_waitress(app: Flask, host: str, port: int):
+    """Serve the app with waitress' fixed worker pool."""
+    logger.info(f"Serving with waitress ({WSGI_THREADS} threads)")
+    waitress_serve(
+        app,
+        host=host,
+        port=port,
+        threads=WSGI_THREADS,
+        connection_limit=500,
+        channel_timeout=120,
+    )
 
 
 def _start_slider_watcher():
@@ -353,7 +579,7 @@ def _start_slider_watcher():
                         last_mtime = mtime
                         # Read and publish status
                         try:
-                            data = json.loads(SLIDER_STATUS_FILE.read_text())
+                            data = fast_json.loads(SLIDER_STATUS_FILE.read_bytes())
                             get_event_bus().publish('slider_update', data)
                         except Exception as e:
                             logger.error(f"Error reading/publishing slider status: {e}")
@@ -390,7 +616,10 @@ def start_server_thread(
         _start_slider_watcher()
         
         app = create_app()
-        app.run(host=host, port=port, debug=False, threaded=True, use_reloader=False)
+        if waitress_serve is not None:
+            _serve_waitress(app, host, port)
+        else:
+            app.run(host=host, port=port, debug=False, threaded=True, use_reloader=False)
     
     thread = threading.Thread(target=run, daemon=True)
     thread.start()